@@ -4,8 +4,14 @@ from sqlalchemy.orm import sessionmaker
 
 DATABASE_URL = "sqlite:///./job_applications.db"
 
+# Sized above the QueuePool defaults (5 + 10 overflow) so bursts of concurrent
+# requests wait briefly for a connection instead of failing with "limit reached"
 engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=20,
+    max_overflow=20,
+    pool_timeout=30,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -1,20 +1,63 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from pydantic import BaseModel, HttpUrl
-from datetime import datetime
-from typing import List, Optional
-import uvicorn
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import IntegrityError
+from pydantic import BaseModel, TypeAdapter, field_validator
+from typing import Any, Dict, List, Optional
+import asyncio
+import gzip
+import re
+from contextlib import asynccontextmanager
+import msgspec
 import os
+from urllib.parse import urlsplit, SplitResult
 
 from database import SessionLocal, engine, Base
-from models import JobApplication, JobApplicationDB
-from scraper import JobScraper
-from url_parser import SmartJobURLParser
+from models import as_utc, ApplicationStatus, JobApplication, JobApplicationMsg, JobApplicationSummary, JobApplicationDB, SourceSite
+from scraper import JobScraper, scrape_succeeded
+from url_parser import SmartJobURLParser, source_site_for_url
 
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Job Application Tracker", version="1.0.0")
+# Shared parser - its word lists and suggestion tries are built once at import
+PARSER = SmartJobURLParser()
+
+# Built once at import and shared by every endpoint that turns rows into responses
+JOB_APP_ADAPTER = TypeAdapter(JobApplication)
+JOB_SUMMARY_ENCODER = msgspec.json.Encoder()
+
+# Shared scraper so its pooled HTTP connections survive across requests
+SCRAPER = JobScraper()
+
+# Caps concurrent scrapes so their blocking parts can't exhaust the worker's threadpool
+SCRAPE_SEMAPHORE = asyncio.Semaphore(int(os.getenv("SCRAPE_CONCURRENCY", "4")))
+
+# Scrapes currently running, keyed by URL, so identical requests share one scrape
+_inflight_scrapes: Dict[str, "asyncio.Future[dict]"] = {}
+
+def _migrate_enum_values():
+    """Lower-case source_site/status on rows written while they were SQLEnum columns.
+
+    SQLEnum stored member names ("LINKEDIN", "APPLIED"); the plain string columns hold the
+    values, which are the same words lower-cased. Safe to run on every startup.
+    """
+    with engine.begin() as conn:
+        conn.execute(text(
+            "UPDATE job_applications SET source_site = lower(source_site), status = lower(status) "
+            "WHERE source_site != lower(source_site) OR status != lower(status)"
+        ))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(_migrate_enum_values)
+    yield
+    await SCRAPER.close()
+
+app = FastAPI(title="Job Application Tracker", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,11 +74,22 @@ def get_db():
     finally:
         db.close()
 
+# One compiled check instead of HttpUrl's full parse - the URL is split once later and reused
+_HTTP_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
+
 class JobURLRequest(BaseModel):
-    url: HttpUrl
+    url: str
+
+    @field_validator("url")
+    @classmethod
+    def validate_url(cls, url: str) -> str:
+        url = url.strip()
+        if not _HTTP_URL_RE.match(url):
+            raise ValueError("URL must be a valid http(s) link")
+        return url
 
-class ParseURLRequest(BaseModel):
-    url: HttpUrl
+class ParseURLRequest(JobURLRequest):
+    pass
 
 class ManualJobRequest(BaseModel):
     job_url: str
@@ -50,16 +104,29 @@ class SuggestionRequest(BaseModel):
     query: str
     type: str  # "company" or "title"
 
-@app.get("/")
+# Response models let FastAPI encode straight to JSON bytes through Pydantic
+class MessageResponse(BaseModel):
+    message: str
+
+class ParseURLResponse(BaseModel):
+    success: bool
+    data: Dict[str, Any]
+    error: Optional[str] = None
+
+class SuggestionResponse(BaseModel):
+    suggestions: List[str]
+
+@app.get("/", response_model=MessageResponse)
 def read_root():
     return {"message": "Job Application Tracker API"}
 
-@app.post("/parse-url")
-async def parse_job_url(request: ParseURLRequest):
+@app.post("/parse-url", response_model=ParseURLResponse)
+def parse_job_url(request: ParseURLRequest):
     """Parse job URL to extract metadata and provide suggestions"""
+    # Plain def: the metadata fetch is a blocking request, so FastAPI runs this in its threadpool
     try:
-        parser = SmartJobURLParser()
-        parsed_data = parser.parse_job_url(str(request.url))
+        # Unknown sites have no URL parser, so they still get a page-metadata lookup
+        parsed_data = PARSER.parse_job_url_parts(request.url, urlsplit(request.url), fetch_metadata=True)
         return {
             "success": True,
             "data": parsed_data
@@ -69,21 +136,19 @@ async def parse_job_url(request: ParseURLRequest):
             "success": False,
             "error": str(e),
             "data": {
-                "job_url": str(request.url),
+                "job_url": request.url,
                 "source_site": "unknown",
-                "suggested_titles": parser.common_job_titles[:10] if 'parser' in locals() else []
+                "suggested_titles": PARSER.top_titles
             }
         }
 
-@app.post("/suggestions")
+@app.post("/suggestions", response_model=SuggestionResponse)
 def get_suggestions(request: SuggestionRequest):
     """Get auto-complete suggestions for companies or job titles"""
-    parser = SmartJobURLParser()
-    
     if request.type == "company":
-        suggestions = parser.get_company_suggestions(request.query)
+        suggestions = PARSER.get_company_suggestions(request.query)
     elif request.type == "title":
-        suggestions = parser.get_title_suggestions(request.query)
+        suggestions = PARSER.get_title_suggestions(request.query)
     else:
         suggestions = []
     
@@ -93,73 +158,114 @@ def get_suggestions(request: SuggestionRequest):
 def add_manual_application(job_request: ManualJobRequest, db: Session = Depends(get_db)):
     """Add job application with manual entry"""
     try:
-        # Create job application from manual data
-        db_job = JobApplicationDB(
-            company_name=job_request.company_name,
-            job_title=job_request.job_title,
-            job_url=job_request.job_url,
-            source_site=SmartJobURLParser()._determine_source_site(job_request.job_url),
-            application_date=datetime.now(),
-            job_description=job_request.job_description or "No description provided",
-            html_snapshot_path=None,  # No HTML for manual entry
-            status=job_request.status or "applied"
-        )
+        # Create job application from manual data - RETURNING hands back id/timestamps without a refresh query
+        db_job = db.execute(
+            insert(JobApplicationDB)
+            .values(
+                company_name=job_request.company_name,
+                job_title=job_request.job_title,
+                job_url=job_request.job_url,
+                # Keyed on the host so the memoized lookup is shared across postings
+                source_site=SourceSite(source_site_for_url(job_request.job_url)).value,
+                job_description=job_request.job_description or "No description provided",
+                html_snapshot_path=None,  # No HTML for manual entry
+                status=ApplicationStatus(job_request.status or "applied").value
+            )
+            .returning(JobApplicationDB)
+        ).scalar_one()
         
-        db.add(db_job)
+        application = JOB_APP_ADAPTER.validate_python(db_job, from_attributes=True)
         db.commit()
-        db.refresh(db_job)
-        
-        return JobApplication.model_validate(db_job)
+        return application
     
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="A job application for this URL already exists")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error adding manual job application: {str(e)}")
 
+def _store_scraped_application(job_url: str, job_data: dict) -> JobApplication:
+    """Save scraped job data, returning the existing application if the URL is already tracked"""
+    # The session is opened only once scraping is done, so slow page loads never pin a pooled connection
+    with SessionLocal() as db:
+        # Single round-trip on the unique job_url index - also safe when identical requests race
+        stmt = (
+            insert(JobApplicationDB)
+            .values(
+                company_name=job_data["company_name"],
+                job_title=job_data["job_title"],
+                job_url=job_url,
+                source_site=SourceSite(job_data["source_site"]).value,
+                job_description=job_data.get("job_description", "No description available"),
+                html_snapshot_path=job_data.get("html_snapshot_path"),
+                status=ApplicationStatus.APPLIED.value
+            )
+            .on_conflict_do_nothing()
+            .returning(JobApplicationDB)
+        )
+        db_job = db.execute(stmt).scalar_one_or_none()
+        
+        if db_job is None:
+            # Nothing was inserted, so this URL is already tracked
+            print(f"Job application already exists for URL: {job_url}")
+            db_job = db.query(JobApplicationDB).filter(JobApplicationDB.job_url == job_url).one()
+        
+        application = JOB_APP_ADAPTER.validate_python(db_job, from_attributes=True)
+        db.commit()
+        return application
+
+def _discard_snapshot(html_path: str):
+    try:
+        os.remove(html_path)
+    except FileNotFoundError:
+        pass  # Already removed by a coalesced request for the same scrape
+
+def _find_application_by_url(job_url: str) -> Optional[JobApplication]:
+    """Look up an already-tracked application by its job URL"""
+    with SessionLocal() as db:
+        application = db.query(JobApplicationDB).filter(JobApplicationDB.job_url == job_url).first()
+        return JOB_APP_ADAPTER.validate_python(application, from_attributes=True) if application else None
+
+async def _run_scrape(job_url: str, parts: SplitResult) -> dict:
+    async with SCRAPE_SEMAPHORE:
+        return await SCRAPER.scrape_job(job_url, parts)
+
+async def _scrape_once(job_url: str, parts: SplitResult) -> dict:
+    """Scrape a URL, joining a scrape of the same URL that is already in progress"""
+    scrape = _inflight_scrapes.get(job_url)
+    if scrape is None:
+        scrape = asyncio.ensure_future(_run_scrape(job_url, parts))
+        _inflight_scrapes[job_url] = scrape
+        scrape.add_done_callback(lambda _: _inflight_scrapes.pop(job_url, None))
+    # Shielded so one client disconnecting doesn't cancel the scrape for the others
+    return await asyncio.shield(scrape)
+
 @app.post("/applications", response_model=JobApplication)
-async def add_application(job_request: JobURLRequest, db: Session = Depends(get_db)):
+async def add_application(job_request: JobURLRequest):
     """Primary scraping endpoint - tries web scraping first, falls back to manual entry"""
     try:
-        scraper = JobScraper()
+        # Already tracked - skip the expensive scrape entirely
+        existing_application = await run_in_threadpool(_find_application_by_url, job_request.url)
+        if existing_application:
+            print(f"Job application already exists for URL: {job_request.url}")
+            return existing_application
+        
         print(f"Attempting to scrape job from URL: {job_request.url}")
-        job_data = await scraper.scrape_job(str(job_request.url))
+        job_data = await _scrape_once(job_request.url, urlsplit(job_request.url))
         
         # Check if scraping was successful (got meaningful data)
-        scraped_successfully = (
-            job_data.get("company_name") not in ["Unknown Company", ""] and
-            job_data.get("job_title") not in ["Unknown Position", ""] and
-            "Error occurred while scraping" not in job_data.get("job_description", "")
-        )
-        
-        if scraped_successfully or job_data.get("extraction_method") == "requests":
-            # Check if this URL already exists to prevent duplicates
-            existing_application = db.query(JobApplicationDB).filter(JobApplicationDB.job_url == str(job_request.url)).first()
-            if existing_application:
-                print(f"Job application already exists for URL: {job_request.url}")
-                return JobApplication.model_validate(existing_application)
-                
-            # Scraping succeeded - save to database
-            db_job = JobApplicationDB(
-                company_name=job_data["company_name"],
-                job_title=job_data["job_title"],
-                job_url=str(job_request.url),
-                source_site=job_data["source_site"],
-                application_date=datetime.now(),
-                job_description=job_data.get("job_description", "No description available"),
-                html_snapshot_path=job_data.get("html_snapshot_path"),
-                status="applied"
-            )
-            
-            db.add(db_job)
-            db.commit()
-            db.refresh(db_job)
-            
-            return JobApplication.model_validate(db_job)
+        if scrape_succeeded(job_data):
+            # Session calls are blocking - run them in the threadpool, not on the event loop
+            return await run_in_threadpool(_store_scraped_application, job_request.url, job_data)
         else:
-            # Scraping failed but didn't crash - return error to trigger manual entry
+            # Scraping failed but didn't crash - return error to trigger manual entry. No row will
+            # point at this result's snapshot, so don't leave it behind.
+            if job_data.get("html_snapshot_path"):
+                await run_in_threadpool(_discard_snapshot, job_data["html_snapshot_path"])
             raise HTTPException(status_code=422, detail={
                 "message": "Could not extract complete job information from URL. Please enter details manually.",
                 "scraped_data": job_data,
                 "fallback_to_manual": True,
-                "url": str(job_request.url)
+                "url": job_request.url
             })
             
     except HTTPException:
@@ -170,23 +276,48 @@ async def add_application(job_request: JobURLRequest, db: Session = Depends(get_
         raise HTTPException(status_code=422, detail={
             "message": f"Error occurred while scraping: {str(e)}. Please enter details manually.",
             "fallback_to_manual": True,
-            "url": str(job_request.url)
+            "url": job_request.url
         })
 
-@app.get("/applications", response_model=List[JobApplication])
-def get_applications(db: Session = Depends(get_db)):
-    applications = db.query(JobApplicationDB).order_by(JobApplicationDB.application_date.desc()).all()
-    return [JobApplication.model_validate(app) for app in applications]
+@app.get("/applications", response_model=List[JobApplicationSummary])
+def get_applications(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    applications = db.execute(
+        select(JobApplicationDB)
+        # List views never show these, so don't pull them from the DB
+        .options(defer(JobApplicationDB.job_description), defer(JobApplicationDB.html_snapshot_path))
+        .order_by(JobApplicationDB.application_date.desc())
+        .limit(limit)
+        .offset(offset)
+    ).scalars().all()
+    # Hottest read path - encode with msgspec structs rather than validating every row through Pydantic
+    page = [
+        JobApplicationMsg(
+            id=app.id,
+            company_name=app.company_name,
+            job_title=app.job_title,
+            job_url=app.job_url,
+            source_site=app.source_site,
+            application_date=as_utc(app.application_date),
+            status=app.status,
+            created_at=as_utc(app.created_at)
+        )
+        for app in applications
+    ]
+    return Response(content=JOB_SUMMARY_ENCODER.encode(page), media_type="application/json")
 
 @app.get("/applications/{app_id}", response_model=JobApplication)
 def get_application(app_id: str, db: Session = Depends(get_db)):
     application = db.query(JobApplicationDB).filter(JobApplicationDB.id == app_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
-    return JobApplication.model_validate(application)
+    return JOB_APP_ADAPTER.validate_python(application, from_attributes=True)
 
 @app.get("/applications/{app_id}/html")
-def get_application_html(app_id: str, db: Session = Depends(get_db)):
+def get_application_html(app_id: str, request: Request, db: Session = Depends(get_db)):
     application = db.query(JobApplicationDB).filter(JobApplicationDB.id == app_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -196,42 +327,48 @@ def get_application_html(app_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="No HTML snapshot available for this application")
     
     try:
-        # Check if file exists
-        if not os.path.exists(application.html_snapshot_path):
-            raise HTTPException(status_code=404, detail="HTML snapshot file not found")
-            
-        with open(application.html_snapshot_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-            
-        if not html_content.strip():
+        # Stat rather than read - the file is streamed as-is instead of being decoded and JSON-encoded
+        if os.path.getsize(application.html_snapshot_path) == 0:
             raise HTTPException(status_code=404, detail="HTML snapshot is empty")
-            
-        return {"html_content": html_content}
-    except FileNotFoundError:
+    except OSError:
         raise HTTPException(status_code=404, detail="HTML snapshot file not found")
-    except UnicodeDecodeError:
-        raise HTTPException(status_code=500, detail="HTML snapshot file is corrupted")
+    
+    path = application.html_snapshot_path
+    if not path.endswith(".gz"):
+        # Snapshot saved before compression was introduced
+        return FileResponse(path, media_type="text/html; charset=utf-8")
+    
+    # Gzipped snapshots go out as stored; only clients that can't take gzip get them inflated
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return FileResponse(
+            path,
+            media_type="text/html; charset=utf-8",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    with gzip.open(path, "rb") as f:
+        return Response(f.read(), media_type="text/html; charset=utf-8", headers={"Vary": "Accept-Encoding"})
+
+def _safe_unlink(path: str) -> None:
+    """Remove a snapshot file, ignoring one that is already gone"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error reading HTML snapshot: {str(e)}")
+        print(f"Warning: Could not delete HTML file: {e}")
 
-@app.delete("/applications/{app_id}")
-def delete_application(app_id: str, db: Session = Depends(get_db)):
+@app.delete("/applications/{app_id}", response_model=MessageResponse)
+def delete_application(app_id: str, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     application = db.query(JobApplicationDB).filter(JobApplicationDB.id == app_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    # Delete HTML snapshot file if it exists
-    if application.html_snapshot_path:
-        try:
-            import os
-            if os.path.exists(application.html_snapshot_path):
-                os.remove(application.html_snapshot_path)
-        except Exception as e:
-            print(f"Warning: Could not delete HTML file: {e}")
-    
+    snapshot_path = application.html_snapshot_path
     db.delete(application)
     db.commit()
+    
+    # Delete HTML snapshot file after responding, so slow filesystems don't delay the client
+    if snapshot_path:
+        background_tasks.add_task(_safe_unlink, snapshot_path)
+    
     return {"message": "Application deleted successfully"}
-
-if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
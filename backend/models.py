@@ -1,12 +1,26 @@
-from sqlalchemy import Column, String, DateTime, Text, Enum as SQLEnum
-from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional
+from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy.sql import func
+from pydantic import AfterValidator, BaseModel
+import msgspec
+from datetime import datetime, timezone
+from typing import Annotated, Optional
 from enum import Enum
+import os
+import time
 import uuid
 
 from database import Base
 
+def _uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7): 48-bit millisecond timestamp followed by random bits"""
+    value = ((time.time_ns() // 1_000_000) << 80) | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+# Python 3.14+ ships uuid.uuid7
+uuid7 = getattr(uuid, "uuid7", _uuid7)
+
 class SourceSite(str, Enum):
     GLASSDOOR = "glassdoor"
     LINKEDIN = "linkedin"
@@ -21,28 +35,52 @@ class ApplicationStatus(str, Enum):
 class JobApplicationDB(Base):
     __tablename__ = "job_applications"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Time-ordered ids keep inserts at the right edge of the primary key index instead of random pages
+    id = Column(String, primary_key=True, default=lambda: str(uuid7()))
     company_name = Column(String, nullable=False)
     job_title = Column(String, nullable=False)
-    job_url = Column(String, nullable=False)
-    source_site = Column(SQLEnum(SourceSite), nullable=False)
-    application_date = Column(DateTime, default=datetime.utcnow)
+    job_url = Column(String, nullable=False, unique=True, index=True)
+    # Plain strings - values are checked against SourceSite/ApplicationStatus before insert
+    source_site = Column(String(16), nullable=False, index=True)
+    # default= as well as server_default=: create_all never alters an existing table, so databases created
+    # before the server default existed would otherwise get NULL timestamps
+    application_date = Column(DateTime, default=func.now(), server_default=func.now(), index=True)
     job_description = Column(Text)
     html_snapshot_path = Column(String)
-    status = Column(SQLEnum(ApplicationStatus), default=ApplicationStatus.APPLIED)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(String(16), nullable=False, index=True, default=ApplicationStatus.APPLIED.value)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+
+def as_utc(value: datetime) -> datetime:
+    """Mark a stored timestamp as UTC - SQLite keeps them naive, and without an offset browsers read them as local time"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+UtcDatetime = Annotated[datetime, AfterValidator(as_utc)]
 
-class JobApplication(BaseModel):
+class JobApplicationSummary(BaseModel):
+    """List-view fields only - leaves out the heavy description column"""
     id: str
     company_name: str
     job_title: str
     job_url: str
     source_site: SourceSite
-    application_date: datetime
-    job_description: Optional[str] = None
-    html_snapshot_path: Optional[str] = None
+    application_date: UtcDatetime
     status: ApplicationStatus
-    created_at: datetime
+    created_at: UtcDatetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class JobApplicationMsg(msgspec.Struct):
+    """msgspec mirror of JobApplicationSummary for encoding list pages - rows are already validated on insert"""
+    id: str
+    company_name: str
+    job_title: str
+    job_url: str
+    source_site: str
+    application_date: datetime
+    status: str
+    created_at: datetime
+
+class JobApplication(JobApplicationSummary):
+    job_description: Optional[str] = None
+    html_snapshot_path: Optional[str] = None
\ No newline at end of file
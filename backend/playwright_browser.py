@@ -0,0 +1,87 @@
+"""Playwright engine for browser scrapes, enabled with SCRAPER_BROWSER=playwright.
+
+Playwright is async-native, so unlike the Selenium pool it runs inside the API process: one
+Chromium is launched on first use and every scrape gets its own short-lived context (cookies
+and storage never leak between jobs). Requires `playwright install chromium`.
+
+On Windows the browser subprocess needs a ProactorEventLoop, which uvicorn only installs when
+it runs a single worker; with WEB_CONCURRENCY > 1, JobScraper falls back to Selenium.
+"""
+import asyncio
+import logging
+import random
+from fnmatch import fnmatch
+from typing import Dict, Sequence, Tuple
+
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+from scraper_worker import BLOCKED_URL_PATTERNS, USER_AGENTS, extract_fields, ready_selectors
+
+logger = logging.getLogger(__name__)
+
+# Resource types a job posting never needs - aborted before they download
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+async def _block_heavy(route):
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        fnmatch(request.url, pattern) for pattern in BLOCKED_URL_PATTERNS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class PlaywrightBrowser:
+    def __init__(self, proxies: Sequence[str] = ()):
+        self._proxies = tuple(proxies)
+        self._playwright = None
+        self._browser = None
+        self._launch_lock = asyncio.Lock()
+
+    async def _get_browser(self):
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        "--disable-blink-features=AutomationControlled",
+                        "--disable-dev-shm-usage",
+                        "--no-sandbox",
+                        "--mute-audio"
+                    ]
+                )
+            return self._browser
+
+    async def scrape(self, url: str, source_site: str) -> Tuple[str, Dict[str, str]]:
+        """Load a job page and return its HTML plus the extracted fields"""
+        browser = await self._get_browser()
+        proxy = random.choice(self._proxies) if self._proxies else None
+        context = await browser.new_context(
+            user_agent=random.choice(USER_AGENTS),
+            proxy={"server": f"http://{proxy}"} if proxy else None
+        )
+        try:
+            await context.route("**/*", _block_heavy)
+            page = await context.new_page()
+            logger.info(f"Scraping {source_site} URL with Playwright: {url}")
+            await page.goto(url, wait_until="domcontentloaded")
+            try:
+                await page.wait_for_selector(", ".join(ready_selectors(source_site)), timeout=10000)
+            except PlaywrightTimeoutError:
+                # Page never showed a known element - give late scripts a moment, then extract what's there
+                await asyncio.sleep(1)
+            html = await page.content()
+        finally:
+            await context.close()
+
+        return html, await asyncio.to_thread(extract_fields, html, source_site)
+
+    async def close(self):
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
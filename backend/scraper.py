@@ -1,23 +1,103 @@
 import os
+import re
+import sys
 import uuid
-import time
 import random
+import gzip
+import shutil
+import asyncio
+import multiprocessing
 import logging
-from typing import Dict, Optional, List
-from urllib.parse import urlparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, List, Union
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, SplitResult
 
-import requests
+import diskcache
+import httpx
+import soupsieve
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium_stealth import stealth
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from seleniumwire import webdriver as wire_webdriver
+
+from models import SourceSite
+from scraper_worker import USER_AGENTS, init_worker, scrape_in_worker
+
+# Supported job boards, matched as a whole domain label of the host (www.linkedin.com, uk.indeed.com, ...)
+_SITE_RE = re.compile(r"(?:^|\.)(?P<site>glassdoor|linkedin|indeed)\.", re.IGNORECASE)
+
+# Browser-like headers sent with every plain-HTTP scrape (the User-Agent is added per request)
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+    "DNT": "1",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+}
+
+# Generic selectors for the plain-HTTP path, in priority order. Each group is matched in a single pass
+# by its joined selector; the per-selector patterns then pick the highest-priority hit from that pass.
+def _selector_group(selectors: List[str]):
+    return soupsieve.compile(", ".join(selectors)), tuple(soupsieve.compile(selector) for selector in selectors)
+
+_TITLE_SEL = _selector_group([
+    'h1[data-testid*="title"]',
+    'h1[class*="job-title"]',
+    'h1[class*="title"]',
+    'h1',
+    '[data-testid*="job-title"]',
+    '[class*="job-title"]'
+])
+_COMPANY_SEL = _selector_group([
+    '[data-testid*="company"]',
+    '[class*="company-name"]',
+    '[class*="employer"]',
+    'a[href*="company"]',
+    'span[class*="company"]'
+])
+_DESC_SEL = _selector_group([
+    '[data-testid*="description"]',
+    '[class*="job-description"]',
+    '[class*="description"]',
+    '[id*="description"]'
+])
+
+# How long a scraped posting is reused before it is fetched again
+_CACHE_TTL = 6 * 3600
+
+# Query parameters that only track where a click came from - dropped so they don't split the cache
+_TRACKING_PARAMS = {"trk", "trkinfo", "refid", "trackingid", "from", "src"}
+
+def _cache_key(parts: SplitResult) -> str:
+    """Normalized URL: lower-cased host, no fragment, tracking parameters removed, the rest sorted"""
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+# source_site values an application row can hold - anything else is rejected on insert
+_STORABLE_SITES = frozenset(site.value for site in SourceSite)
+
+def scrape_succeeded(job_data: Dict[str, str]) -> bool:
+    """Whether a scrape result is good enough to store as an application (and so to cache).
+    The site must be a SourceSite; plain-HTTP results are then accepted as-is, while browser
+    results need a real company, title and description."""
+    if job_data.get("source_site") not in _STORABLE_SITES:
+        return False
+    if job_data.get("extraction_method") == "requests":
+        return True
+    return (
+        job_data.get("company_name") not in ["Unknown Company", ""] and
+        job_data.get("job_title") not in ["Unknown Position", ""] and
+        "Error occurred while scraping" not in job_data.get("job_description", "")
+    )
+
+def _is_utf8(encoding: Optional[str]) -> bool:
+    return (encoding or "utf-8").lower().replace("_", "-") in ("utf-8", "utf8", "ascii", "us-ascii")
 
 class JobScraper:
     def __init__(self):
@@ -26,14 +106,6 @@ class JobScraper:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
-        # Rotate between different user agents to avoid detection
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
-        
         # Free proxy list (you can expand this or use a proxy service)
         self.proxy_list = [
             # Format: "ip:port" - these are example proxies, replace with working ones
@@ -52,6 +124,68 @@ class JobScraper:
         
         self.current_proxy_index = 0
         
+        # Scrape results by normalized URL; diskcache is process-safe, so every API worker shares it
+        self._cache = diskcache.Cache(os.path.join(self.snapshots_dir, ".cache"), size_limit=2 * 1024 ** 3)
+        
+        # Pooled async HTTP clients, keyed by proxy ("" for direct), created on first use
+        self._http_clients: Dict[str, httpx.AsyncClient] = {}
+        
+        # How each site is scraped: "selenium_only" skips the plain-HTTP attempt entirely
+        self._site_policy = {
+            "linkedin": "selenium_only",
+            "glassdoor": "selenium_only",
+            "indeed": "requests_first",
+            "unknown": "requests_first"
+        }
+        # Consecutive successful plain-HTTP scrapes per host, used to shorten the pre-request delay
+        self._host_success = Counter()
+        
+        # Bounds concurrent scrapes to avoid rate limits and connection blowups
+        self._sem = asyncio.BoundedSemaphore(20)
+        # One bucket per supported job board plus one shared by every other host, so the set of
+        # semaphores stays fixed however many distinct hosts get scraped
+        self._per_site_sem = {site: asyncio.BoundedSemaphore(2) for site in self._site_policy}
+        
+        # Selenium runs in a pool of worker processes, each owning one long-lived Chrome.
+        # Started on the first browser scrape so the API never launches Chrome it doesn't need.
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_size = int(os.getenv("SELENIUM_WORKERS", "4"))
+        
+        # Opt-in Playwright engine, run in-process instead of the Selenium pool
+        self._playwright = None
+        if os.getenv("SCRAPER_BROWSER", "selenium").lower() == "playwright":
+            from playwright_browser import PlaywrightBrowser
+            self._playwright = PlaywrightBrowser(self.proxy_list)
+        
+    async def close(self):
+        """Close pooled HTTP connections and the Selenium worker processes"""
+        for client in self._http_clients.values():
+            await client.aclose()
+        self._http_clients.clear()
+        if self._pool:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+        if self._playwright:
+            await self._playwright.close()
+        self._cache.close()
+        
+    @staticmethod
+    def _playwright_supported() -> bool:
+        # Playwright drives its browser through a subprocess, which Windows' SelectorEventLoop
+        # can't create; uvicorn hands multi-worker processes exactly that loop
+        return sys.platform != "win32" or isinstance(asyncio.get_running_loop(), asyncio.ProactorEventLoop)
+        
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._pool_size,
+                # spawn rather than fork - forking a process with a running event loop and threads is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(tuple(self.proxy_list),)
+            )
+        return self._pool
+        
     def _load_free_proxies(self):
         """Load free proxies from a public API (optional)"""
         try:
@@ -73,212 +207,129 @@ class JobScraper:
         self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxy_list)
         return proxy
         
-    def _get_chrome_driver(self, use_proxy: bool = True):
-        """Configure Chrome driver with proven anti-detection techniques"""
-        proxy = self._get_next_proxy() if use_proxy else None
-        
-        # Use selenium-wire if proxy is available, otherwise regular selenium
-        if proxy:
-            seleniumwire_options = {
-                'proxy': {
-                    'http': f'http://{proxy}',
-                    'https': f'http://{proxy}',
-                    'no_proxy': 'localhost,127.0.0.1'
-                }
-            }
-            
-            options = wire_webdriver.ChromeOptions()
-            self.logger.info(f"Using proxy: {proxy}")
-        else:
-            seleniumwire_options = {}
-            options = webdriver.ChromeOptions()
-            
-        options.add_argument("--headless")
-        options.add_argument("--start-maximized")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Additional anti-detection arguments
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-web-security")
-        options.add_argument("--allow-running-insecure-content")
-        options.add_argument("--disable-extensions")
-        
-        # Random user agent
-        user_agent = random.choice(self.user_agents)
-        options.add_argument(f"--user-agent={user_agent}")
-        
-        if proxy:
-            driver = wire_webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager().install()),
-                options=options,
-                seleniumwire_options=seleniumwire_options
+    def _get_http_client(self, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        """Get the shared HTTP client for a proxy so TCP/TLS connections are reused across scrapes"""
+        key = proxy or ""
+        client = self._http_clients.get(key)
+        if client is None:
+            # Keep-alive pool plus transport-level retries for dropped connections
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                proxy=f"http://{proxy}" if proxy else None
             )
-        else:
-            driver = webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager().install()), 
-                options=options
+            client = httpx.AsyncClient(
+                transport=transport,
+                timeout=30,
+                follow_redirects=True,
+                # Constant browser headers live on the client - only the User-Agent varies per request
+                headers=_BASE_HEADERS
             )
+            self._http_clients[key] = client
+        return client
         
-        # Apply selenium-stealth - this is the key anti-detection technique
-        stealth(driver,
-                languages=["en-US", "en"],
-                vendor="Google Inc.",
-                platform="Win32",
-                webgl_vendor="Intel Inc.",
-                renderer="Intel Iris OpenGL Engine",
-                fix_hairline=True,
-        )
-        
-        return driver
+    def _determine_source_site(self, url: str, parts: Optional[SplitResult] = None) -> str:
+        # Match on the host only, so a job board mentioned in a path or query string doesn't count
+        match = _SITE_RE.search((parts or urlsplit(url)).netloc)
+        return match.group("site").lower() if match else 'unknown'
 
-    def _find_element_with_fallbacks(self, driver, selectors_list, method="css"):
-        """Find element using multiple fallback selectors"""
-        for selector in selectors_list:
-            try:
-                if method == "css":
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                elif method == "xpath":
-                    element = driver.find_element(By.XPATH, selector)
-                else:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                
-                text = element.text.strip()
-                if text:  # Only return non-empty text
-                    return text
-            except (NoSuchElementException, TimeoutException):
-                continue
-        return None
+    def _write_snapshot(self, filepath: str, html_content: Union[str, bytes]):
+        # Raw response bytes are written as-is; only browser page_source strings need encoding
+        if isinstance(html_content, str):
+            html_content = html_content.encode('utf-8')
+        # compresslevel=1 keeps the CPU cost low while still shrinking pages a lot
+        with open(filepath, 'wb') as f:
+            f.write(gzip.compress(html_content, compresslevel=1))
 
-    def _find_element_attribute_with_fallbacks(self, driver, selectors_list, attribute="href"):
-        """Find element attribute using multiple fallback selectors"""
-        for selector in selectors_list:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                attr_value = element.get_attribute(attribute)
-                if attr_value:
-                    return attr_value
-            except (NoSuchElementException, TimeoutException):
-                continue
+    async def _save_html_snapshot(self, html_content: Union[str, bytes], job_id: str) -> str:
+        """Write a gzipped snapshot off the event loop; the API serves it with Content-Encoding: gzip"""
+        filename = f"{job_id}.html.gz"
+        filepath = os.path.join(self.snapshots_dir, filename)
+        
+        await asyncio.to_thread(self._write_snapshot, filepath, html_content)
+        
+        return filepath
+
+    @staticmethod
+    def _first_text(soup: BeautifulSoup, group, limit: Optional[int] = None) -> Optional[str]:
+        """Text of the first match of the highest-priority selector whose first match has visible text -
+        same result as select_one() per selector in order, but the tree is walked once.
+        With a limit, stops collecting text once that many characters have been gathered."""
+        joined, patterns = group
+        # First element (document order) for each selector index, like select_one() would return
+        firsts = {}
+        for element in joined.select(soup):
+            for index, pattern in enumerate(patterns):
+                if index not in firsts and pattern.match(element):
+                    firsts[index] = element
+            if len(firsts) == len(patterns):
+                break
+        
+        for index in sorted(firsts):
+            element = firsts[index]
+            if limit is None:
+                text = element.get_text(strip=True)
+            else:
+                text = JobScraper._bounded_text(element, limit)
+            if text:
+                return text
         return None
 
-    def _determine_source_site(self, url: str) -> str:
-        domain = urlparse(url).netloc.lower()
-        if 'glassdoor' in domain:
-            return 'glassdoor'
-        elif 'linkedin' in domain:
-            return 'linkedin'
-        elif 'indeed' in domain:
-            return 'indeed'
-        else:
-            return 'unknown'
+    @staticmethod
+    def _bounded_text(element, limit: int) -> str:
+        """Same text as get_text(strip=True)[:limit] without walking the rest of a long subtree"""
+        parts = []
+        size = 0
+        for string in element.stripped_strings:
+            parts.append(string)
+            size += len(string)
+            if size >= limit:
+                break
+        return "".join(parts)[:limit]
 
-    def _save_html_snapshot(self, html_content: str, job_id: str) -> str:
-        filename = f"{job_id}.html"
-        filepath = os.path.join(self.snapshots_dir, filename)
+    def _extract_job_fields(self, html: bytes) -> Dict[str, Optional[str]]:
+        """Pull title, company and description out of raw HTML (CPU-bound, runs off the event loop)"""
+        soup = BeautifulSoup(html, 'lxml')
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        job_title = self._first_text(soup, _TITLE_SEL)
+        company_name = self._first_text(soup, _COMPANY_SEL)
+        job_description = self._first_text(soup, _DESC_SEL, limit=2000)  # Limit length
         
-        return filepath
+        return {
+            "company_name": company_name,
+            "job_title": job_title,
+            "job_description": job_description
+        }
 
-    def _try_requests_scraping(self, url: str) -> Optional[Dict[str, str]]:
-        """Try scraping with requests first - faster and less likely to be blocked"""
+    async def _try_requests_scraping(self, url: str, host: str = "") -> Optional[Dict[str, str]]:
+        """Try scraping with plain HTTP first - faster and less likely to be blocked"""
         try:
-            # Random delay between 2-10 seconds
-            delay = random.uniform(2, 10)
-            time.sleep(delay)
+            # Random delay (non-blocking, other requests keep being served) - shortened once a host
+            # has answered several plain requests in a row
+            if self._host_success[host] > 3:
+                delay = random.uniform(0.2, 1.0)
+            else:
+                delay = random.uniform(2, 10)
+            await asyncio.sleep(delay)
             
             # Use random user agent
-            user_agent = random.choice(self.user_agents)
-            
-            headers = {
-                "User-Agent": user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none",
-                "Cache-Control": "max-age=0",
-            }
+            user_agent = random.choice(USER_AGENTS)
             
+
             # Setup proxy if available
-            proxies = None
             proxy = self._get_next_proxy()
             if proxy:
-                proxies = {
-                    'http': f'http://{proxy}',
-                    'https': f'http://{proxy}'
-                }
                 self.logger.info(f"Using proxy for requests: {proxy}")
             
             self.logger.info(f"Attempting requests-based scraping for: {url}")
-            response = requests.get(
-                url, 
-                headers=headers, 
-                timeout=30, 
-                allow_redirects=True,
-                proxies=proxies
-            )
+            response = await self._get_http_client(proxy).get(url, headers={"User-Agent": user_agent})
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Generic extraction using common patterns
-                job_title = None
-                company_name = None
-                job_description = None
-                
-                # Try to find job title
-                title_selectors = [
-                    'h1[data-testid*="title"]',
-                    'h1[class*="job-title"]',
-                    'h1[class*="title"]',
-                    'h1',
-                    '[data-testid*="job-title"]',
-                    '[class*="job-title"]'
-                ]
-                
-                for selector in title_selectors:
-                    element = soup.select_one(selector)
-                    if element and element.get_text(strip=True):
-                        job_title = element.get_text(strip=True)
-                        break
-                
-                # Try to find company name
-                company_selectors = [
-                    '[data-testid*="company"]',
-                    '[class*="company-name"]',
-                    '[class*="employer"]',
-                    'a[href*="company"]',
-                    'span[class*="company"]'
-                ]
-                
-                for selector in company_selectors:
-                    element = soup.select_one(selector)
-                    if element and element.get_text(strip=True):
-                        company_name = element.get_text(strip=True)
-                        break
-                
-                # Try to find description
-                desc_selectors = [
-                    '[data-testid*="description"]',
-                    '[class*="job-description"]',
-                    '[class*="description"]',
-                    '[id*="description"]'
-                ]
-                
-                for selector in desc_selectors:
-                    element = soup.select_one(selector)
-                    if element and element.get_text(strip=True):
-                        job_description = element.get_text(strip=True)[:2000]  # Limit length
-                        break
+                fields = await asyncio.to_thread(self._extract_job_fields, response.content)
+                job_title = fields["job_title"]
+                company_name = fields["company_name"]
+                job_description = fields["job_description"]
                 
                 if job_title or company_name:  # If we got something useful
                     self.logger.info(f"Successfully extracted data with requests: {job_title} at {company_name}")
@@ -286,7 +337,9 @@ class JobScraper:
                         "company_name": company_name or "Unknown Company",
                         "job_title": job_title or "Unknown Position",
                         "job_description": job_description or "No description available",
-                        "html_content": response.text,
+                        # Keep the undecoded body when it's already UTF-8 (what the snapshot endpoint
+                        # declares) instead of decoding to str just to re-encode it
+                        "html_content": response.content if _is_utf8(response.encoding) else response.text,
                         "extraction_method": "requests"
                     }
             else:
@@ -297,168 +350,71 @@ class JobScraper:
             
         return None
 
-    async def _scrape_linkedin(self, driver, url: str) -> Dict[str, str]:
-        self.logger.info(f"Scraping LinkedIn URL: {url}")
-        driver.get(url)
-        time.sleep(5)
-        
-        # Multiple selectors for company name
-        company_selectors = [
-            ".job-details-jobs-unified-top-card__company-name a",
-            ".job-details-jobs-unified-top-card__company-name",
-            "[data-testid='job-details-company-name']",
-            ".jobs-unified-top-card__company-name a",
-            ".jobs-unified-top-card__company-name",
-            ".job-details-company a",
-            ".job-details-company",
-            "a[data-control-name='job_details_topcard_company_url']"
-        ]
-        company_name = self._find_element_with_fallbacks(driver, company_selectors) or "Unknown Company"
-        
-        # Multiple selectors for job title  
-        title_selectors = [
-            ".job-details-jobs-unified-top-card__job-title a",
-            ".job-details-jobs-unified-top-card__job-title", 
-            ".jobs-unified-top-card__job-title a",
-            ".jobs-unified-top-card__job-title",
-            "h1[data-testid='job-details-job-title']",
-            "h1.job-details-job-title",
-            "h1.jobs-unified-top-card__job-title",
-            "h1"
-        ]
-        job_title = self._find_element_with_fallbacks(driver, title_selectors) or "Unknown Position"
-        
-        # Multiple selectors for job description
-        description_selectors = [
-            ".job-details-jobs-unified-top-card__job-description",
-            ".jobs-description-content__text",
-            ".jobs-box__html-content",
-            ".job-details-job-description",
-            "[data-testid='job-details-job-description']",
-            ".jobs-description__content",
-            ".job-view-layout .jobs-box__html-content"
-        ]
-        job_description = self._find_element_with_fallbacks(driver, description_selectors) or "No description available"
-        
-        self.logger.info(f"Successfully scraped LinkedIn job: {job_title} at {company_name}")
-        
-        return {
-            "company_name": company_name,
-            "job_title": job_title,
-            "job_description": job_description,
-            "source_site": "linkedin"
-        }
+    async def scrape_job(self, url: str, parts: Optional[SplitResult] = None) -> Dict[str, str]:
+        parts = parts or urlsplit(url)
+        
+        # Recently scraped posting - skip the network entirely, provided its snapshot still exists
+        key = _cache_key(parts)
+        cached = await asyncio.to_thread(self._reuse_cached, key)
+        if cached:
+            self.logger.info(f"Using cached scrape for: {url}")
+            return cached
+        
+        job_data = await self._scrape_job_limited(url, parts)
+        # Partial results (auth walls, crashed workers) are not cached, so a retry scrapes again
+        if job_data.get("html_snapshot_path") and scrape_succeeded(job_data):
+            await asyncio.to_thread(self._cache.set, key, job_data, expire=_CACHE_TTL)
+        return job_data
 
-    async def _scrape_glassdoor(self, driver, url: str) -> Dict[str, str]:
-        self.logger.info(f"Scraping Glassdoor URL: {url}")
-        driver.get(url)
-        time.sleep(5)
-        
-        # Multiple selectors for company name
-        company_selectors = [
-            "[data-test='employer-name']",
-            ".employer-name",
-            "[data-testid='employer-name']",
-            ".jobview-header-employer-name",
-            ".job-details-employer-name",
-            "span[data-test='employer-name']",
-            ".employer-info span"
-        ]
-        company_name = self._find_element_with_fallbacks(driver, company_selectors) or "Unknown Company"
-        
-        # Multiple selectors for job title
-        title_selectors = [
-            "[data-test='job-title']",
-            ".job-title",
-            "[data-testid='job-title']", 
-            ".jobview-header-job-title",
-            ".job-details-job-title",
-            "h1[data-test='job-title']",
-            "h1.job-title"
-        ]
-        job_title = self._find_element_with_fallbacks(driver, title_selectors) or "Unknown Position"
-        
-        # Multiple selectors for job description
-        description_selectors = [
-            "[data-test='job-description-content']",
-            ".job-description-content",
-            "[data-testid='job-description-content']",
-            ".jobview-job-description-content", 
-            ".job-details-description-content",
-            ".jobDescriptionContent",
-            "#job-description-content"
-        ]
-        job_description = self._find_element_with_fallbacks(driver, description_selectors) or "No description available"
-        
-        self.logger.info(f"Successfully scraped Glassdoor job: {job_title} at {company_name}")
-        
-        return {
-            "company_name": company_name,
-            "job_title": job_title,
-            "job_description": job_description,
-            "source_site": "glassdoor"
-        }
+    def _reuse_cached(self, key: str) -> Optional[Dict[str, str]]:
+        """Cached result with its own link to the snapshot, so deleting one application can't
+        remove the file another one points at"""
+        cached = self._cache.get(key)
+        if not cached:
+            return None
+        html_path = os.path.join(self.snapshots_dir, f"{uuid.uuid4()}.html.gz")
+        try:
+            os.link(cached["html_snapshot_path"], html_path)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            # Filesystem without hard links
+            try:
+                shutil.copyfile(cached["html_snapshot_path"], html_path)
+            except FileNotFoundError:
+                return None
+        return {**cached, "html_snapshot_path": html_path}
 
-    async def _scrape_indeed(self, driver, url: str) -> Dict[str, str]:
-        self.logger.info(f"Scraping Indeed URL: {url}")
-        driver.get(url)
-        time.sleep(5)  # Longer wait for anti-detection
-        
-        # Multiple selectors for company name (based on working scraper)
-        company_selectors = [
-            "[data-testid='inlineHeader-companyName']",
-            "[data-testid='company-name']",
-            "span[data-testid='company-name']",
-            ".icl-u-lg-mr--sm",
-            "span[class*='company']",
-            "[data-testid='jobsearch-CompanyInfoContainer'] span",
-            ".jobsearch-CompanyInfoWithoutHeaderImage span"
-        ]
-        company_name = self._find_element_with_fallbacks(driver, company_selectors) or "Unknown Company"
-        
-        # Multiple selectors for job title
-        title_selectors = [
-            "[data-testid='jobsearch-JobInfoHeader-title']",
-            "h1[data-testid='jobsearch-JobInfoHeader-title']",
-            "h1.jobsearch-JobInfoHeader-title",
-            "h1",
-            ".jobsearch-JobInfoHeader-title",
-            "[data-testid='job-title']"
-        ]
-        job_title = self._find_element_with_fallbacks(driver, title_selectors) or "Unknown Position"
-        
-        # Multiple selectors for job description
-        description_selectors = [
-            "#jobDescriptionText",
-            "[data-testid='jobsearch-JobComponent-description']",
-            ".jobsearch-JobComponent-description",
-            "[data-testid='job-description']",
-            ".jobDescriptionContent",
-            "#job-description"
-        ]
-        job_description = self._find_element_with_fallbacks(driver, description_selectors) or "No description available"
-        
-        self.logger.info(f"Successfully scraped Indeed job: {job_title} at {company_name}")
-        
-        return {
-            "company_name": company_name,
-            "job_title": job_title,
-            "job_description": job_description,
-            "source_site": "indeed"
-        }
+    async def _scrape_job_limited(self, url: str, parts: SplitResult) -> Dict[str, str]:
+        # At most a couple of scrapes against any one job board, under the global cap. The site slot is
+        # taken first so URLs queued behind one busy site don't sit on global slots.
+        async with self._per_site_sem[self._determine_source_site(url, parts)], self._sem:
+            return await self._scrape_job(url, parts)
+
+    async def scrape_jobs(self, urls: List[str]) -> List[Dict[str, str]]:
+        """Scrape several URLs concurrently; results come back in the order of `urls`"""
+        return await asyncio.gather(*(self.scrape_job(url) for url in urls))
 
-    async def scrape_job(self, url: str) -> Dict[str, str]:
-        source_site = self._determine_source_site(url)
+    async def _scrape_job(self, url: str, parts: SplitResult) -> Dict[str, str]:
+        host = parts.netloc.lower()
+        source_site = self._determine_source_site(url, parts)
         job_id = str(uuid.uuid4())
         
         self.logger.info(f"Starting to scrape job from {source_site}: {url}")
         
-        # Step 1: Try requests-based scraping first (faster, less detectable)
-        requests_result = self._try_requests_scraping(url)
+        # Step 1: Try requests-based scraping first (faster, less detectable), unless the site
+        # only ever serves an auth wall / JS shell to plain HTTP clients
+        requests_result = None
+        if self._site_policy.get(source_site, "requests_first") == "requests_first":
+            requests_result = await self._try_requests_scraping(url, host)
+            if requests_result:
+                self._host_success[host] += 1
+            else:
+                self._host_success.pop(host, None)
         if requests_result:
             # Save HTML snapshot from requests result
             try:
-                html_path = self._save_html_snapshot(requests_result["html_content"], job_id)
+                html_path = await self._save_html_snapshot(requests_result["html_content"], job_id)
                 requests_result["html_snapshot_path"] = html_path
                 requests_result["source_site"] = source_site
                 del requests_result["html_content"]  # Remove from result to keep it clean
@@ -467,42 +423,37 @@ class JobScraper:
             except Exception as e:
                 self.logger.error(f"Failed to save HTML from requests scraping: {e}")
         
-        # Step 2: Fall back to Selenium if requests failed
-        self.logger.info("Requests scraping failed, falling back to Selenium...")
-        driver = None
+        # Step 2: Fall back to a real browser if requests failed
+        if self._site_policy.get(source_site) == "selenium_only":
+            self.logger.info(f"{source_site} needs a browser, scraping with a browser...")
+        else:
+            self.logger.info("Requests scraping failed, falling back to a browser...")
+        return await self._scrape_with_selenium(url, source_site, job_id)
+
+    async def _scrape_with_selenium(self, url: str, source_site: str, job_id: str) -> Dict[str, str]:
+        pool = None
         try:
-            driver = self._get_chrome_driver()
-            
             # Add random delay to avoid detection patterns
             delay = random.uniform(3, 8)  # 3-8 seconds delay
-            time.sleep(delay)
+            await asyncio.sleep(delay)
             
-            if source_site == 'linkedin':
-                job_data = await self._scrape_linkedin(driver, url)
-            elif source_site == 'glassdoor':
-                job_data = await self._scrape_glassdoor(driver, url)
-            elif source_site == 'indeed':
-                job_data = await self._scrape_indeed(driver, url)
+            if self._playwright and not self._playwright_supported():
+                self.logger.warning(
+                    "Playwright needs a Proactor event loop on Windows, which uvicorn only uses "
+                    "with a single worker - falling back to Selenium"
+                )
+                self._playwright = None
+            if self._playwright:
+                html_content, job_data = await self._playwright.scrape(url, source_site)
             else:
-                # Generic scraping fallback
-                self.logger.warning(f"Unknown source site: {source_site}, attempting generic scraping")
-                driver.get(url)
-                time.sleep(5)
-                
-                # Try to extract basic info generically
-                generic_title = self._find_element_with_fallbacks(driver, ["h1", "title", ".job-title", ".title"])
-                
-                job_data = {
-                    "company_name": "Unknown Company",
-                    "job_title": generic_title or "Unknown Position", 
-                    "job_description": "No description available",
-                    "source_site": source_site
-                }
+                pool = self._get_pool()
+                html_content, job_data = await asyncio.get_running_loop().run_in_executor(
+                    pool, scrape_in_worker, url, source_site
+                )
             
-            # Save HTML snapshot
+            # Save HTML snapshot from the page source the fields were extracted from
             try:
-                html_content = driver.page_source
-                html_path = self._save_html_snapshot(html_content, job_id)
+                html_path = await self._save_html_snapshot(html_content, job_id)
                 job_data["html_snapshot_path"] = html_path
                 self.logger.info(f"HTML snapshot saved: {html_path}")
             except Exception as e:
@@ -514,6 +465,12 @@ class JobScraper:
             
         except Exception as e:
             self.logger.error(f"Error scraping job from {url}: {str(e)}")
+            if isinstance(e, BrokenProcessPool) and pool is not None:
+                # A worker died (e.g. Chrome took it down) - reap the broken pool and start a fresh one
+                # on the next scrape (unless a concurrent scrape already replaced it)
+                if self._pool is pool:
+                    self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
             # Return partial data even on error
             return {
                 "company_name": "Unknown Company",
@@ -522,10 +479,3 @@ class JobScraper:
                 "source_site": source_site,
                 "html_snapshot_path": None
             }
-            
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
\ No newline at end of file
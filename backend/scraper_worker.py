@@ -0,0 +1,354 @@
+"""Selenium scraping that runs inside JobScraper's worker processes.
+
+Selenium drivers can't be shared safely between threads, so each worker process owns one
+long-lived Chrome (started by init_worker) and scrapes one page at a time with it.
+"""
+import atexit
+import logging
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import InvalidSessionIdException, SessionNotCreatedException, TimeoutException
+from selenium_stealth import stealth
+from selenium.webdriver.chrome.service import Service as ChromeService
+from webdriver_manager.chrome import ChromeDriverManager
+from seleniumwire import webdriver as wire_webdriver
+
+logger = logging.getLogger(__name__)
+
+# Rotate between different user agents to avoid detection
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Requests Chrome drops before they leave the browser - none of this is needed to read a posting
+BLOCKED_URL_PATTERNS = (
+    "*.doubleclick.net/*",
+    "*.google-analytics.com/*",
+    "*/collect*",
+    "*/beacon*",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.mp4",
+    "*.png",
+    "*.jpg",
+    "*.gif"
+)
+
+# Selectors per site, each list in priority order. The title selectors double as the
+# "page is ready" signal when waiting for a job page to render.
+SITE_SELECTORS = {
+    "linkedin": {
+        "name": "LinkedIn",
+        "title": [
+            ".job-details-jobs-unified-top-card__job-title a",
+            ".job-details-jobs-unified-top-card__job-title", 
+            ".jobs-unified-top-card__job-title a",
+            ".jobs-unified-top-card__job-title",
+            "h1[data-testid='job-details-job-title']",
+            "h1.job-details-job-title",
+            "h1.jobs-unified-top-card__job-title",
+            "h1"
+        ],
+        "company": [
+            ".job-details-jobs-unified-top-card__company-name a",
+            ".job-details-jobs-unified-top-card__company-name",
+            "[data-testid='job-details-company-name']",
+            ".jobs-unified-top-card__company-name a",
+            ".jobs-unified-top-card__company-name",
+            ".job-details-company a",
+            ".job-details-company",
+            "a[data-control-name='job_details_topcard_company_url']"
+        ],
+        "description": [
+            ".job-details-jobs-unified-top-card__job-description",
+            ".jobs-description-content__text",
+            ".jobs-box__html-content",
+            ".job-details-job-description",
+            "[data-testid='job-details-job-description']",
+            ".jobs-description__content",
+            ".job-view-layout .jobs-box__html-content"
+        ]
+    },
+    "glassdoor": {
+        "name": "Glassdoor",
+        "title": [
+            "[data-test='job-title']",
+            ".job-title",
+            "[data-testid='job-title']", 
+            ".jobview-header-job-title",
+            ".job-details-job-title",
+            "h1[data-test='job-title']",
+            "h1.job-title"
+        ],
+        "company": [
+            "[data-test='employer-name']",
+            ".employer-name",
+            "[data-testid='employer-name']",
+            ".jobview-header-employer-name",
+            ".job-details-employer-name",
+            "span[data-test='employer-name']",
+            ".employer-info span"
+        ],
+        "description": [
+            "[data-test='job-description-content']",
+            ".job-description-content",
+            "[data-testid='job-description-content']",
+            ".jobview-job-description-content", 
+            ".job-details-description-content",
+            ".jobDescriptionContent",
+            "#job-description-content"
+        ]
+    },
+    "indeed": {
+        "name": "Indeed",
+        "title": [
+            "[data-testid='jobsearch-JobInfoHeader-title']",
+            "h1[data-testid='jobsearch-JobInfoHeader-title']",
+            "h1.jobsearch-JobInfoHeader-title",
+            "h1",
+            ".jobsearch-JobInfoHeader-title",
+            "[data-testid='job-title']"
+        ],
+        "company": [
+            "[data-testid='inlineHeader-companyName']",
+            "[data-testid='company-name']",
+            "span[data-testid='company-name']",
+            ".icl-u-lg-mr--sm",
+            "span[class*='company']",
+            "[data-testid='jobsearch-CompanyInfoContainer'] span",
+            ".jobsearch-CompanyInfoWithoutHeaderImage span"
+        ],
+        "description": [
+            "#jobDescriptionText",
+            "[data-testid='jobsearch-JobComponent-description']",
+            ".jobsearch-JobComponent-description",
+            "[data-testid='job-description']",
+            ".jobDescriptionContent",
+            "#job-description"
+        ]
+    }
+}
+GENERIC_TITLE_SELECTORS = ["h1", "title", ".job-title", ".title"]
+# Waited on for unknown sites - <title> (and the catch-all .title) exist before a JS-rendered page has
+# drawn anything, so they are only used for extraction
+GENERIC_READY_SELECTORS = ["h1", ".job-title"]
+
+# Per-process state, set up by init_worker
+_driver = None
+_proxies: Tuple[str, ...] = ()
+_chromedriver_path: Optional[str] = None
+
+def init_worker(proxies: Sequence[str] = ()):
+    """Pool initializer: start this process's Chrome up front so the first scrape doesn't pay for it"""
+    global _proxies
+    logging.basicConfig(level=logging.INFO)
+    _proxies = tuple(proxies)
+    atexit.register(_quit_driver)
+    try:
+        _get_driver()
+    except Exception as e:
+        # Leave it to the first scrape to retry (and report) - a failing initializer breaks the whole pool
+        logger.error(f"Could not start Chrome in worker: {e}")
+
+def _get_chromedriver_path(refresh: bool = False) -> str:
+    """Resolve the chromedriver binary once per process - install() checks the cache dir and network.
+    Resolved lazily rather than at import so the API can start without Chrome installed.
+    refresh=True resolves it again, e.g. after Chrome auto-updated past the cached driver."""
+    global _chromedriver_path
+    if _chromedriver_path is None or refresh:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+def _get_driver():
+    """Return this worker's driver, launching Chrome on first use or after its session ended"""
+    global _driver
+    if _driver is None or _driver.session_id is None:
+        _driver = _get_chrome_driver()
+    return _driver
+
+def _reset_driver(driver):
+    """Clear state between jobs, discarding the driver if the browser is unusable"""
+    try:
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception:
+        _quit_driver()
+
+def _quit_driver():
+    global _driver
+    driver, _driver = _driver, None
+    if driver:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+def _launch_chrome(options, seleniumwire_options: dict):
+    if seleniumwire_options:
+        return wire_webdriver.Chrome(
+            service=ChromeService(_get_chromedriver_path()),
+            options=options,
+            seleniumwire_options=seleniumwire_options
+        )
+    return webdriver.Chrome(
+        service=ChromeService(_get_chromedriver_path()), 
+        options=options
+    )
+
+def _get_chrome_driver(use_proxy: bool = True):
+    """Configure Chrome driver with proven anti-detection techniques"""
+    proxy = random.choice(_proxies) if use_proxy and _proxies else None
+
+    # Use selenium-wire if proxy is available, otherwise regular selenium
+    if proxy:
+        seleniumwire_options = {
+            'proxy': {
+                'http': f'http://{proxy}',
+                'https': f'http://{proxy}',
+                'no_proxy': 'localhost,127.0.0.1'
+            }
+        }
+
+        options = wire_webdriver.ChromeOptions()
+        logger.info(f"Using proxy: {proxy}")
+    else:
+        seleniumwire_options = {}
+        options = webdriver.ChromeOptions()
+
+    options.add_argument("--headless=new")
+    options.add_argument("--start-maximized")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    # Additional anti-detection arguments
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-web-security")
+    options.add_argument("--allow-running-insecure-content")
+    options.add_argument("--disable-extensions")
+
+    # Only the DOM matters for scraping - skip images, GPU work, audio and notification prompts
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--mute-audio")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+
+    # Random user agent
+    user_agent = random.choice(USER_AGENTS)
+    options.add_argument(f"--user-agent={user_agent}")
+
+    try:
+        driver = _launch_chrome(options, seleniumwire_options)
+    except SessionNotCreatedException as e:
+        if "version" not in str(e).lower():
+            raise
+        # Chrome auto-updated past the cached chromedriver - resolve a matching one and retry once
+        logger.warning("Chromedriver does not match the installed Chrome, re-resolving it")
+        _get_chromedriver_path(refresh=True)
+        driver = _launch_chrome(options, seleniumwire_options)
+
+    # Apply selenium-stealth - this is the key anti-detection technique
+    stealth(driver,
+            languages=["en-US", "en"],
+            vendor="Google Inc.",
+            platform="Win32",
+            webgl_vendor="Intel Inc.",
+            renderer="Intel Iris OpenGL Engine",
+            fix_hairline=True,
+    )
+
+    # Refuse ads, analytics, fonts and media at the network layer so they never download
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+    except Exception as e:
+        logger.warning(f"Could not set blocked URLs via CDP: {e}")
+
+    return driver
+
+def _first_text_with_fallbacks(soup: BeautifulSoup, selectors_list: List[str], separator: str = " ") -> Optional[str]:
+    """Text of the first selector in priority order that matches a non-empty element"""
+    for selector in selectors_list:
+        element = soup.select_one(selector)
+        if element:
+            text = element.get_text(separator, strip=True)
+            if text:
+                return text
+    return None
+
+def _load_page(driver, url: str, ready_selectors: List[str], timeout: float = 10):
+    """Navigate and wait until any of the given selectors is present instead of sleeping a fixed time"""
+    driver.get(url)
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(ready_selectors)))
+        )
+    except TimeoutException:
+        # Page never showed a known element - give late scripts a moment, then extract what's there
+        time.sleep(1)
+
+def ready_selectors(source_site: str) -> List[str]:
+    """Selectors whose presence means a page of this site has rendered enough to extract"""
+    site = SITE_SELECTORS.get(source_site)
+    return site["title"] if site else GENERIC_READY_SELECTORS
+
+def extract_fields(html: str, source_site: str) -> Dict[str, str]:
+    """Pull company, title and description out of a rendered job page (shared by both browser engines)"""
+    soup = BeautifulSoup(html, 'lxml')
+    site = SITE_SELECTORS.get(source_site)
+    if site is None:
+        # Generic scraping fallback
+        logger.warning(f"Unknown source site: {source_site}, attempting generic scraping")
+        generic_title = _first_text_with_fallbacks(soup, GENERIC_TITLE_SELECTORS)
+        return {
+            "company_name": "Unknown Company",
+            "job_title": generic_title or "Unknown Position", 
+            "job_description": "No description available",
+            "source_site": source_site
+        }
+    
+    company_name = _first_text_with_fallbacks(soup, site["company"]) or "Unknown Company"
+    job_title = _first_text_with_fallbacks(soup, site["title"]) or "Unknown Position"
+    job_description = _first_text_with_fallbacks(soup, site["description"], "\n") or "No description available"
+    
+    logger.info(f"Successfully scraped {site['name']} job: {job_title} at {company_name}")
+    
+    return {
+        "company_name": company_name,
+        "job_title": job_title,
+        "job_description": job_description,
+        "source_site": source_site
+    }
+
+def scrape_in_worker(url: str, source_site: str) -> Tuple[str, Dict[str, str]]:
+    """Scrape one job page with this worker's Chrome; returns the page HTML and the extracted fields"""
+    driver = _get_driver()
+    try:
+        logger.info(f"Scraping {source_site} URL: {url}")
+        _load_page(driver, url, ready_selectors(source_site))
+        # Read the page once - fields come from this HTML, not further WebDriver commands
+        html = driver.page_source
+        return html, extract_fields(html, source_site)
+    except InvalidSessionIdException:
+        # Chrome died under us - drop it so the next scrape launches a fresh one
+        _quit_driver()
+        driver = None
+        raise
+    finally:
+        if driver:
+            _reset_driver(driver)
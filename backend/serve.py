@@ -0,0 +1,24 @@
+"""Start the API server: python serve.py
+
+Kept separate from main.py on purpose. Uvicorn's extra workers and the Selenium pool are spawned
+processes, and spawn re-imports the launching script as __mp_main__ in every child; launching from
+this file means they re-import nothing but uvicorn, instead of repeating main's table creation,
+cache open and parser build.
+"""
+import os
+
+import uvicorn
+
+if __name__ == "__main__":
+    # A single worker suits a local SQLite app and keeps duplicate-scrape coalescing in one process.
+    # Deployments can raise WEB_CONCURRENCY; "auto" picks uvloop where it is installed (not on Windows)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="auto",
+        http="httptools",
+        log_level="warning",
+        access_log=False,
+    )
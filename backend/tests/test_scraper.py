@@ -0,0 +1,56 @@
+from urllib.parse import urlsplit
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scraper import JobScraper, _COMPANY_SEL, _DESC_SEL, _TITLE_SEL, _cache_key, scrape_succeeded
+
+
+PAGE = """
+<nav><a href="/company/about">About us</a></nav>
+<div class="description">Short</div>
+<h1></h1>
+<h1 class="x-title">Real Title</h1>
+<div data-testid="company-name">Acme</div>
+<section data-testid="job-description">Full job description here</section>
+"""
+
+
+@pytest.fixture
+def soup():
+    return BeautifulSoup(PAGE, "lxml")
+
+
+def test_first_text_keeps_selector_priority(soup):
+    # Earlier-listed selectors win even when a later one matches higher up the page
+    assert JobScraper._first_text(soup, _COMPANY_SEL) == "Acme"
+    assert JobScraper._first_text(soup, _DESC_SEL) == "Full job description here"
+
+
+def test_first_text_skips_empty_first_match(soup):
+    assert JobScraper._first_text(soup, _TITLE_SEL) == "Real Title"
+
+
+def test_first_text_limit(soup):
+    assert JobScraper._first_text(soup, _DESC_SEL, limit=4) == "Full"
+
+
+def test_first_text_no_match():
+    assert JobScraper._first_text(BeautifulSoup("<p>hi</p>", "lxml"), _COMPANY_SEL) is None
+
+
+def test_cache_key_normalizes_tracking():
+    parts = urlsplit("HTTPS://WWW.Indeed.com/viewjob?jk=2&from=serp&utm_medium=1&a=1#x")
+    assert _cache_key(parts) == "https://www.indeed.com/viewjob?a=1&jk=2"
+
+
+@pytest.mark.parametrize("job_data, ok", [
+    ({"company_name": "Acme", "job_title": "Dev", "job_description": "d", "source_site": "linkedin"}, True),
+    ({"company_name": "Unknown Company", "job_title": "Unknown Position", "job_description": "d", "source_site": "linkedin"}, False),
+    ({"company_name": "Acme", "job_title": "Dev", "job_description": "Error occurred while scraping: boom", "source_site": "indeed"}, False),
+    ({"company_name": "Unknown Company", "job_title": "T", "extraction_method": "requests", "source_site": "indeed"}, True),
+    # Unsupported hosts can't be stored as applications, so they don't count as successes either
+    ({"company_name": "Acme", "job_title": "Dev", "extraction_method": "requests", "source_site": "unknown"}, False),
+])
+def test_scrape_succeeded(job_data, ok):
+    assert scrape_succeeded(job_data) is ok
@@ -0,0 +1,126 @@
+import pytest
+
+from url_parser import SmartJobURLParser, _clean_page_title, source_site_for_url
+
+
+@pytest.fixture
+def parser():
+    return SmartJobURLParser()
+
+
+def test_metadata_is_only_fetched_when_asked(parser, monkeypatch):
+    calls = []
+    monkeypatch.setattr(SmartJobURLParser, "_get_page_metadata",
+                        lambda self, url: calls.append(url) or {"job_title": "Dev"})
+    parser.parse_job_url("https://example.org/careers/1")
+    parser.parse_job_url("https://www.linkedin.com/jobs/view/7", fetch_metadata=True)
+    assert calls == []
+    assert parser.parse_job_url("https://example.org/careers/1", fetch_metadata=True)["job_title"] == "Dev"
+
+
+def test_top_titles(parser):
+    assert len(parser.top_titles) == 10
+    assert parser.parse_job_url("https://www.linkedin.com/jobs/view/1")["suggested_titles"] == parser.top_titles
+
+
+def test_suggestions(parser):
+    assert parser.get_company_suggestions("goo") == ["Google"]
+    assert parser.get_title_suggestions("data") == ["Data Scientist", "Data Analyst"]
+    assert len(parser.get_title_suggestions("")) == 10
+
+
+def test_suggestions_tolerate_typos(parser):
+    assert parser.get_company_suggestions("Gogle") == ["Google"]
+    assert parser.get_title_suggestions("Dta Scientst") == ["Data Scientist"]
+    assert parser.get_company_suggestions("xyz") == []
+
+
+def test_parse_indeed_subdomain(parser):
+    result = parser.parse_job_url("https://ca.indeed.com/viewjob?jk=abc123&l=Toronto")
+    assert result["source_site"] == "indeed"
+    assert result["job_id"] == "abc123"
+    assert result["location"] == "Toronto"
+
+
+def test_parse_url_with_port(parser):
+    assert parser.parse_job_url("https://linkedin.com:443/jobs/view/9")["job_id"] == "9"
+
+
+@pytest.mark.parametrize("page_title, expected", [
+    # A bare job-site suffix is not a company
+    ("Software Engineer - Jobs", ("Software Engineer", None)),
+    ("Data Analyst - Indeed.com", ("Data Analyst", None)),
+    ("Backend Developer - Glassdoor", ("Backend Developer", None)),
+    ("Software Engineer - LinkedIn", ("Software Engineer", None)),
+    ("Software Engineer | LinkedIn", ("Software Engineer", None)),
+    ("Senior Dev at Acme - LinkedIn", ("Senior Dev", "Acme")),
+    ("Engineer - Acme | Glassdoor", ("Engineer", "Acme")),
+    ("Engineer - Acme - Remote | LinkedIn", ("Engineer - Acme", "Remote")),
+    ("Engineer @ Acme", ("Engineer", "Acme")),
+    ("Engineer AT Acme", ("Engineer AT Acme", None)),
+    ("Engineer at Acme-Corp | LinkedIn", ("Engineer at Acme-Corp", None)),
+    ("Plain Title", ("Plain Title", None)),
+])
+def test_clean_page_title(page_title, expected):
+    assert _clean_page_title(page_title) == expected
+
+
+def test_parse_result_is_a_copy(parser):
+    url = "https://www.linkedin.com/jobs/view/42"
+    first = parser.parse_job_url(url)
+    first["job_id"] = "changed"
+    first["parsed_data"]["extra"] = True
+    second = parser.parse_job_url(url)
+    assert second["job_id"] == "42"
+    assert "extra" not in second["parsed_data"]
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.glassdoor.com/job-listing/senior-software-engineer-acme-JV_ID55.htm",
+    "https://www.glassdoor.com/job-listing/senior-software-engineer-acme-JV_IC1132348_KO0,24_KE25,29.htm?jl=55",
+])
+def test_parse_glassdoor_slug(parser, url):
+    result = parser.parse_job_url(url)
+    assert result["source_site"] == "glassdoor"
+    assert result["job_title"] == "Senior Software"
+    assert result["company_name"] == "Engineer Acme"
+
+
+def test_scan_head(parser):
+    head = (b'<head><title> Dev &amp; Ops at Acme </title>'
+            b'<meta property="og:description" content="og">'
+            b"<meta content='It&#39;s good' name='description'></head>")
+    assert parser._scan_head(head) == ("Dev & Ops at Acme", "It's good")
+
+
+def test_scan_head_falls_back_to_soup(parser):
+    assert parser._scan_head(b'<head><title>Unclosed')[0] == "Unclosed"
+
+
+@pytest.mark.parametrize("url, site", [
+    ("https://www.linkedin.com/jobs/view/123", "linkedin"),
+    ("https://ca.indeed.com/viewjob?jk=abc", "indeed"),
+    ("https://www.glassdoor.co.uk/job-listing/x-JV_ID1.htm", "glassdoor"),
+    ("https://jobs.google.com/x", "google_jobs"),
+    ("glassdoor.com/job-listing/x", "glassdoor"),
+    ("https://example.org/careers/1", "other"),
+])
+def test_source_site_for_url(url, site):
+    assert source_site_for_url(url) == site
+
+
+def test_parse_linkedin(parser):
+    result = parser.parse_job_url("https://www.linkedin.com/jobs/view/1234567890/?trk=x")
+    assert result["source_site"] == "linkedin"
+    assert result["job_id"] == "1234567890"
+
+
+def test_parse_indeed_search_url_is_rejected(parser):
+    result = parser.parse_job_url("https://ca.indeed.com/jobs?q=python")
+    assert result["source_site"] == "unknown"
+    assert "search results URL" in result["error"]
+
+
+def test_parse_ziprecruiter_company(parser):
+    result = parser.parse_job_url("https://www.ziprecruiter.com/jobs/acme-co/123")
+    assert result["company_name"] == "Acme Co"
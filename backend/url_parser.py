@@ -1,22 +1,294 @@
 import re
+import html
+import threading
+import time
 import requests
-from urllib.parse import urlparse, parse_qs
-from typing import Dict, Optional, List
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit, parse_qs, SplitResult
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from rapidfuzz import process, fuzz, utils
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Compiled once instead of going through re's pattern cache on every parse
+_LINKEDIN_JOB_RE = re.compile(r'/jobs/view/(\d+)')
+_LINKEDIN_COMPANY_RE = re.compile(r'linkedin\.com/company/([^/?]+)')
+_GLASSDOOR_ID_RE = re.compile(r'JV_ID(\d+)')
+_GLASSDOOR_SLUG_RE = re.compile(r'/([^/]+?)-JV_[^/]*\.htm$')
+_GLASSDOOR_SLUG_SPLIT_RE = re.compile(r'[- ]+')
+# "Job Title at Company - LinkedIn": the job-site suffix is cut first, then the company is read off the end
+_TITLE_SUFFIX_RE = re.compile(r'\s*[-|]\s*(Indeed\.com|LinkedIn|Glassdoor|Jobs).*$', re.IGNORECASE)
+_COMPANY_AT_RE = re.compile(r'\s(?:at|@|-)\s([^-|]+)$')
+
+def _clean_page_title(page_title: str) -> Tuple[str, Optional[str]]:
+    """Split a page title into (job title, company), dropping common job site suffixes.
+    Each pattern is searched once and the title sliced at the match - no re.sub passes."""
+    suffix_match = _TITLE_SUFFIX_RE.search(page_title)
+    if suffix_match:
+        page_title = page_title[:suffix_match.start()]
+    page_title = page_title.strip()
+    
+    # Common patterns: "Job Title at Company Name" or "Job Title - Company Name"
+    company_match = _COMPANY_AT_RE.search(page_title)
+    if not company_match:
+        return page_title, None
+    return page_title[:company_match.start()].strip(), company_match.group(1).strip()
+
+# Metadata only needs <title> and <meta> - everything else is skipped while parsing
+_HEAD_STRAINER = SoupStrainer(['title', 'meta'])
+_TITLE_TAG_RE = re.compile(rb'<title[^>]*>(.*?)</title', re.IGNORECASE | re.DOTALL)
+_HEAD_END_RE = re.compile(rb'</head', re.IGNORECASE)
+
+def _decode_field(raw: bytes) -> str:
+    """Decode just a captured field - the rest of the head stays bytes"""
+    text = raw.decode('utf-8', 'replace')
+    return (html.unescape(text) if '&' in text else text).strip()
+
+def _meta_content_re(attr: bytes, value: bytes) -> 're.Pattern[bytes]':
+    """<meta attr="value" content="..."> with the attributes in either order and either quote style"""
+    selector = attr + rb'\s*=\s*["\']' + re.escape(value) + rb'["\']'
+    content = rb'content\s*=\s*(?:"([^"]*)"|\'([^\']*)\')'
+    return re.compile(
+        rb'<meta\s[^>]*?(?:' + selector + rb'[^>]*?\s' + content + rb'|' + content + rb'[^>]*?\s' + selector + rb')',
+        re.IGNORECASE
+    )
+
+# Checked in order, same precedence as before: name="description" wins over og:description
+_META_DESCRIPTION_RES = (_meta_content_re(b'name', b'description'), _meta_content_re(b'property', b'og:description'))
+_HEAD_READ_BYTES = 64 * 1024
+_HEAD_READ_MORE_BYTES = 256 * 1024
+
+# Minimum RapidFuzz WRatio (0-100) for a misspelt suggestion query to still match
+_FUZZY_SCORE_CUTOFF = 75
+
+# Parsed URLs kept per parser - import batches and re-pastes of the same link skip parsing and fetching
+_PARSE_CACHE_SIZE = 1024
+
+# Threads for parse_urls - metadata fetches are network-bound, so they overlap well
+_PARSE_WORKERS = 16
+
+# A URL whose metadata fetch failed is answered with {} for this long instead of waiting out another timeout
+_FAILED_FETCH_TTL = 60
+_FAILED_FETCH_MAX = 1024
+
+# Domain label -> source site, so ca.indeed.com and linkedin.co.uk resolve with a hash lookup per label
+_TOKEN_TO_SITE = {
+    'linkedin': 'linkedin',
+    'indeed': 'indeed',
+    'glassdoor': 'glassdoor',
+    'google': 'google_jobs',
+    'ziprecruiter': 'ziprecruiter',
+}
+
+@lru_cache(maxsize=4096)
+def _source_site_for_domain(domain: str) -> str:
+    """Map a domain to its source site - pure, and users post to a handful of domains"""
+    # Walk labels right to left (skipping the TLD) - the registrable name is almost always tok[-2]
+    labels = domain.partition(':')[0].split('.')
+    for label in reversed(labels[:-1] or labels):
+        site = _TOKEN_TO_SITE.get(label)
+        if site:
+            return site
+    return 'other'
+
+def source_site_for_url(url: str) -> str:
+    """Source site for a job URL; bare "host/path" input (no scheme) falls back to the raw text"""
+    return _source_site_for_domain((_cached_urlsplit(url).netloc or url).lower())
+
+def _fast_linkedin_id(url: str) -> Optional[str]:
+    """Job id from .../jobs/view/<id>, by slicing for the usual shape and regex only for odd ones"""
+    _, sep, rest = url.partition('/jobs/view/')
+    if not sep:
+        return None
+    candidate = rest.split('?', 1)[0].split('/', 1)[0]
+    if candidate.isdigit():
+        return candidate
+    match = _LINKEDIN_JOB_RE.search(url)
+    return match.group(1) if match else None
+
+def _fast_glassdoor_id(url: str) -> Optional[str]:
+    """Job id from ...JV_ID<id>.htm, same approach as _fast_linkedin_id"""
+    _, sep, rest = url.partition('JV_ID')
+    if not sep:
+        return None
+    candidate = rest.split('.', 1)[0]
+    if candidate.isdigit():
+        return candidate
+    match = _GLASSDOOR_ID_RE.search(url)
+    return match.group(1) if match else None
+
+@lru_cache(maxsize=4096)
+def _cached_urlsplit(url: str) -> SplitResult:
+    return urlsplit(url)
+
+@lru_cache(maxsize=4096)
+def _cached_parse_qs(query: str) -> Dict[str, List[str]]:
+    """parse_qs memoized by query string - the dict is shared between callers, so treat it as read-only"""
+    return parse_qs(query)
+
+class _TrieNode:
+    __slots__ = ('children', 'matches')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.matches: List[int] = []
+
+class SuggestionTrie:
+    """Character trie over every suffix of a list of names.
+
+    Each node records which names pass through it, so walking the query lands
+    on every name that contains it - O(len(query)) instead of a scan per call.
+    Queries that fall off the trie get a RapidFuzz pass so typos still suggest.
+    """
+
+    def __init__(self, names: List[str]):
+        self.names = list(names)
+        self._root = _TrieNode()
+        for index, name in enumerate(self.names):
+            lowered = name.lower()
+            for start in range(len(lowered)):
+                node = self._root
+                for char in lowered[start:]:
+                    node = node.children.setdefault(char, _TrieNode())
+                    if not node.matches or node.matches[-1] != index:
+                        node.matches.append(index)
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """Return up to `limit` names containing `query`, in original order"""
+        if not query:
+            return self.names[:limit]
+
+        node = self._root
+        for char in query.lower():
+            node = node.children.get(char)
+            if node is None:
+                return self.fuzzy_search(query, limit)
+        return [self.names[index] for index in node.matches[:limit]]
+
+    def fuzzy_search(self, query: str, limit: int = 10) -> List[str]:
+        """Typo-tolerant fallback for queries no name contains (e.g. 'Gogle')"""
+        matches = process.extract(
+            query, self.names, scorer=fuzz.WRatio, processor=utils.default_process,
+            limit=limit, score_cutoff=_FUZZY_SCORE_CUTOFF
+        )
+        return [name for name, _score, _index in matches]
+
+def _parse_linkedin_url(url: str, parsed_url) -> Dict[str, Optional[str]]:
+    """Parse LinkedIn job URL"""
+    # LinkedIn job URLs: https://www.linkedin.com/jobs/view/1234567890
+    job_id = _fast_linkedin_id(url)
+
+    # Try to extract company from URL if present
+    company_match = _LINKEDIN_COMPANY_RE.search(url)
+    company_name = company_match.group(1).replace('-', ' ').title() if company_match else None
+
+    return {
+        'job_id': job_id,
+        'company_name': company_name,
+        'parsed_data': {'linkedin_job_id': job_id}
+    }
+
+def _parse_indeed_url(url: str, parsed_url) -> Dict[str, Optional[str]]:
+    """Parse Indeed job URL"""
+    query_params = _cached_parse_qs(parsed_url.query)
+
+    # Indeed job URLs can be:
+    # 1. https://www.indeed.com/viewjob?jk=abc123def456
+    # 2. https://ca.indeed.com/jobs?...&vjk=jobkey (mobile/search with specific job)
+    job_id = query_params.get('jk', [None])[0] or query_params.get('vjk', [None])[0]
+
+    # Check if this is a search results URL without a specific job
+    if not job_id and 'q=' in parsed_url.query:
+        # This is a search results URL, not a specific job URL
+        raise ValueError(
+            "This appears to be a search results URL without a specific job selected. "
+            "Please click on a specific job posting and copy that URL instead. "
+            "Look for URLs that contain 'viewjob' or a 'vjk' parameter."
+        )
+
+    # Extract location from URL if present
+    location = query_params.get('l', [None])[0]
+
+    return {
+        'job_id': job_id,
+        'location': location,
+        'parsed_data': {'indeed_job_key': job_id}
+    }
+
+def _parse_glassdoor_url(url: str, parsed_url) -> Dict[str, Optional[str]]:
+    """Parse Glassdoor job URL"""
+    # Glassdoor URLs: https://www.glassdoor.com/job-listing/title-company-location-JV_ID123456.htm
+    job_id = _fast_glassdoor_id(url)
+
+    # Try to extract company and title from the slug in front of JV_ID / JV_IC
+    slug_match = _GLASSDOOR_SLUG_RE.search(parsed_url.path)
+    if slug_match:
+        parts = _GLASSDOOR_SLUG_SPLIT_RE.split(slug_match.group(1))
+        if len(parts) >= 3:
+            # Rough extraction - first part might be title, second company
+            potential_title = ' '.join(parts[:2]).title()
+            potential_company = ' '.join(parts[2:4]).title()
+            return {
+                'job_id': job_id,
+                'job_title': potential_title,
+                'company_name': potential_company,
+                'parsed_data': {'glassdoor_job_id': job_id}
+            }
+
+    return {
+        'job_id': job_id,
+        'parsed_data': {'glassdoor_job_id': job_id}
+    }
+
+def _parse_google_jobs_url(url: str, parsed_url) -> Dict[str, Optional[str]]:
+    """Parse Google Jobs URL"""
+    # Google Jobs URLs often have job info in query params
+    query_params = _cached_parse_qs(parsed_url.query)
+
+    # Extract various possible parameters
+    location = query_params.get('l', [None])[0] or query_params.get('location', [None])[0]
+    query = query_params.get('q', [None])[0]
+
+    return {
+        'job_title': query,
+        'location': location,
+        'parsed_data': {'google_jobs_query': query}
+    }
+
+def _parse_ziprecruiter_url(url: str, parsed_url) -> Dict[str, Optional[str]]:
+    """Parse ZipRecruiter URL"""
+    # ZipRecruiter URLs: https://www.ziprecruiter.com/jobs/company-name/job-id
+    path_parts = parsed_url.path.strip('/').split('/')
+
+    if 'jobs' in path_parts:
+        jobs_index = path_parts.index('jobs')
+        if len(path_parts) > jobs_index + 1:
+            company_slug = path_parts[jobs_index + 1].replace('-', ' ').title()
+            return {'company_name': company_slug}
+
+    return {}
+
 class SmartJobURLParser:
     """Smart URL parser that extracts job information from URLs without heavy scraping"""
     
+    __slots__ = (
+        'company_patterns', 'common_job_titles', 'common_companies', 'session', '_top_titles',
+        '_company_trie', '_title_trie', '_parse_cache', '_parse_cache_lock', '_failed_fetches',
+        '_failed_fetches_lock'
+    )
+    
     def __init__(self):
         self.company_patterns = {
-            'linkedin.com': self._parse_linkedin_url,
-            'indeed.com': self._parse_indeed_url,
-            'glassdoor.com': self._parse_glassdoor_url,
-            'jobs.google.com': self._parse_google_jobs_url,
-            'ziprecruiter.com': self._parse_ziprecruiter_url,
+            'linkedin.com': _parse_linkedin_url,
+            'indeed.com': _parse_indeed_url,
+            'glassdoor.com': _parse_glassdoor_url,
+            'jobs.google.com': _parse_google_jobs_url,
+            'ziprecruiter.com': _parse_ziprecruiter_url,
         }
         
         # Common job titles for suggestions
@@ -27,15 +299,75 @@ class SmartJobURLParser:
             'Backend Developer', 'Full Stack Developer', 'UX Designer',
             'Data Analyst', 'Technical Writer', 'QA Engineer', 'Consultant'
         ]
+        
+        # Common companies for suggestions (could be enhanced with a company database)
+        self.common_companies = [
+            'Google', 'Microsoft', 'Apple', 'Amazon', 'Meta', 'Netflix',
+            'Tesla', 'Uber', 'Airbnb', 'Spotify', 'Adobe', 'Salesforce',
+            'IBM', 'Oracle', 'Intel', 'NVIDIA', 'Twitter', 'LinkedIn'
+        ]
+        
+        # Pooled session so metadata fetches reuse TCP/TLS connections across URLs
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        })
+        
+        # Shared by every parse result instead of slicing a fresh list per call
+        self._top_titles = tuple(self.common_job_titles[:10])
+        
+        # Prebuilt once so suggestion lookups don't rescan the lists per keystroke
+        self._company_trie = SuggestionTrie(self.common_companies)
+        self._title_trie = SuggestionTrie(self.common_job_titles)
+        
+        # LRU of finished parse results keyed on (url, fetch_metadata); a plain lru_cache
+        # can't skip failed fetches, which should be retried rather than remembered
+        self._parse_cache: 'OrderedDict[tuple, Dict]' = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        
+        # url -> monotonic time its last metadata fetch failed (negative cache, see _FAILED_FETCH_TTL)
+        self._failed_fetches: Dict[str, float] = {}
+        self._failed_fetches_lock = threading.Lock()
     
-    def parse_job_url(self, url: str) -> Dict[str, Optional[str]]:
+    @property
+    def top_titles(self) -> Tuple[str, ...]:
+        """The ten job titles suggested alongside every parse result"""
+        return self._top_titles
+    
+    def parse_job_url(self, url: str, fetch_metadata: bool = False) -> Dict[str, Optional[str]]:
         """Extract job information from URL"""
+        return self.parse_job_url_parts(url, None, fetch_metadata)
+    
+    def parse_urls(self, urls: List[str], fetch_metadata: bool = False) -> List[Dict[str, Optional[str]]]:
+        """Parse a batch of URLs concurrently, results in input order"""
+        if len(urls) <= 1:
+            return [self.parse_job_url(url, fetch_metadata) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(_PARSE_WORKERS, len(urls))) as executor:
+            return list(executor.map(lambda url: self.parse_job_url(url, fetch_metadata), urls))
+    
+    def parse_job_url_parts(self, url: str, parsed_url: Optional[SplitResult], fetch_metadata: bool = False) -> Dict[str, Optional[str]]:
+        """Extract job information from a URL the caller has already split, avoiding a second parse.
+        Only fetches the page (fetch_metadata=True) for sites without a dedicated URL parser."""
+        cache_key = (url, fetch_metadata)
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(cache_key)
+            if cached is not None:
+                self._parse_cache.move_to_end(cache_key)
+        if cached is not None:
+            # Copy so callers can't mutate the cached entry
+            return {**cached, 'parsed_data': dict(cached['parsed_data'])}
+        
         try:
-            parsed_url = urlparse(url)
+            if parsed_url is None:
+                parsed_url = _cached_urlsplit(url)
             domain = parsed_url.netloc.lower()
             
             # Remove www. prefix
-            domain = re.sub(r'^www\.', '', domain)
+            if domain.startswith('www.'):
+                domain = domain[4:]
             
             result = {
                 'job_url': url,
@@ -44,23 +376,28 @@ class SmartJobURLParser:
                 'company_name': None,
                 'job_title': None,
                 'location': None,
-                'suggested_titles': self.common_job_titles[:10],  # Top 10 suggestions
+                'suggested_titles': self._top_titles,  # Top 10 suggestions
                 'parsed_data': {}
             }
             
             # Use specific parser if available
-            for site_pattern, parser_func in self.company_patterns.items():
-                if site_pattern in domain:
-                    parsed_data = parser_func(url, parsed_url)
-                    result.update(parsed_data)
-                    break
+            parser_func = self._parser_for_domain(domain)
+            if parser_func:
+                result.update(parser_func(url, parsed_url))
             
             # Try to get basic page metadata if no specific parser
-            if not result.get('job_title'):
+            if fetch_metadata and not result.get('job_title') and result['source_site'] == 'other':
                 metadata = self._get_page_metadata(url)
                 result.update(metadata)
-                
-            return result
+                if not metadata:
+                    # Fetch failed - don't pin the empty result in the cache
+                    return result
+            
+            with self._parse_cache_lock:
+                self._parse_cache[cache_key] = result
+                if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
+            return {**result, 'parsed_data': dict(result['parsed_data'])}
             
         except Exception as e:
             logger.error(f"Error parsing URL {url}: {str(e)}")
@@ -71,157 +408,47 @@ class SmartJobURLParser:
                 'company_name': None,
                 'job_title': None,
                 'location': None,
-                'suggested_titles': self.common_job_titles[:10],
+                'suggested_titles': self._top_titles,
                 'error': str(e)
             }
     
+    def _parser_for_domain(self, domain: str):
+        """Look up the site parser by exact host, then by its last two labels (ca.indeed.com -> indeed.com)"""
+        host = domain.partition(':')[0]
+        parser_func = self.company_patterns.get(host)
+        if parser_func is None:
+            parser_func = self.company_patterns.get('.'.join(host.rsplit('.', 2)[-2:]))
+        return parser_func
+    
     def _determine_source_site(self, domain: str) -> str:
         """Determine source site from domain"""
-        if 'linkedin' in domain:
-            return 'linkedin'
-        elif 'indeed' in domain:
-            return 'indeed'
-        elif 'glassdoor' in domain:
-            return 'glassdoor'
-        elif 'google' in domain:
-            return 'google_jobs'
-        elif 'ziprecruiter' in domain:
-            return 'ziprecruiter'
-        else:
-            return 'other'
-    
-    def _parse_linkedin_url(self, url: str, parsed_url) -> Dict[str, Optional[str]]:
-        """Parse LinkedIn job URL"""
-        # LinkedIn job URLs: https://www.linkedin.com/jobs/view/1234567890
-        job_id_match = re.search(r'/jobs/view/(\d+)', url)
-        job_id = job_id_match.group(1) if job_id_match else None
-        
-        # Try to extract company from URL if present
-        company_match = re.search(r'linkedin\.com/company/([^/?]+)', url)
-        company_name = company_match.group(1).replace('-', ' ').title() if company_match else None
-        
-        return {
-            'job_id': job_id,
-            'company_name': company_name,
-            'parsed_data': {'linkedin_job_id': job_id}
-        }
-    
-    def _parse_indeed_url(self, url: str, parsed_url) -> Dict[str, Optional[str]]:
-        """Parse Indeed job URL"""
-        query_params = parse_qs(parsed_url.query)
-        
-        # Indeed job URLs can be:
-        # 1. https://www.indeed.com/viewjob?jk=abc123def456
-        # 2. https://ca.indeed.com/jobs?...&vjk=jobkey (mobile/search with specific job)
-        job_id = query_params.get('jk', [None])[0] or query_params.get('vjk', [None])[0]
-        
-        # Check if this is a search results URL without a specific job
-        if not job_id and 'q=' in parsed_url.query:
-            # This is a search results URL, not a specific job URL
-            raise ValueError(
-                "This appears to be a search results URL without a specific job selected. "
-                "Please click on a specific job posting and copy that URL instead. "
-                "Look for URLs that contain 'viewjob' or a 'vjk' parameter."
-            )
-        
-        # Extract location from URL if present
-        location = query_params.get('l', [None])[0]
-        
-        return {
-            'job_id': job_id,
-            'location': location,
-            'parsed_data': {'indeed_job_key': job_id}
-        }
-    
-    def _parse_glassdoor_url(self, url: str, parsed_url) -> Dict[str, Optional[str]]:
-        """Parse Glassdoor job URL"""
-        # Glassdoor URLs: https://www.glassdoor.com/job-listing/title-company-location-JV_ID123456.htm
-        job_id_match = re.search(r'JV_ID(\d+)', url)
-        job_id = job_id_match.group(1) if job_id_match else None
-        
-        # Try to extract company and title from URL path
-        path_parts = parsed_url.path.split('/')
-        if len(path_parts) > 2:
-            job_listing_part = path_parts[-1].replace('.htm', '').replace('-', ' ')
-            parts = job_listing_part.split(' ')
-            if len(parts) >= 3:
-                # Rough extraction - first part might be title, second company
-                potential_title = ' '.join(parts[:2]).title()
-                potential_company = ' '.join(parts[2:4]).title()
-                return {
-                    'job_id': job_id,
-                    'job_title': potential_title,
-                    'company_name': potential_company,
-                    'parsed_data': {'glassdoor_job_id': job_id}
-                }
-        
-        return {
-            'job_id': job_id,
-            'parsed_data': {'glassdoor_job_id': job_id}
-        }
-    
-    def _parse_google_jobs_url(self, url: str, parsed_url) -> Dict[str, Optional[str]]:
-        """Parse Google Jobs URL"""
-        # Google Jobs URLs often have job info in query params
-        query_params = parse_qs(parsed_url.query)
-        
-        # Extract various possible parameters
-        location = query_params.get('l', [None])[0] or query_params.get('location', [None])[0]
-        query = query_params.get('q', [None])[0]
-        
-        return {
-            'job_title': query,
-            'location': location,
-            'parsed_data': {'google_jobs_query': query}
-        }
-    
-    def _parse_ziprecruiter_url(self, url: str, parsed_url) -> Dict[str, Optional[str]]:
-        """Parse ZipRecruiter URL"""
-        # ZipRecruiter URLs: https://www.ziprecruiter.com/jobs/company-name/job-id
-        path_parts = parsed_url.path.strip('/').split('/')
-        
-        if 'jobs' in path_parts:
-            jobs_index = path_parts.index('jobs')
-            if len(path_parts) > jobs_index + 1:
-                company_slug = path_parts[jobs_index + 1].replace('-', ' ').title()
-                return {'company_name': company_slug}
-        
-        return {}
+        return _source_site_for_domain(domain)
     
     def _get_page_metadata(self, url: str) -> Dict[str, Optional[str]]:
         """Get basic page metadata using simple HTTP request"""
+        with self._failed_fetches_lock:
+            failed_at = self._failed_fetches.get(url)
+            if failed_at is not None:
+                if time.monotonic() - failed_at < _FAILED_FETCH_TTL:
+                    return {}
+                del self._failed_fetches[url]
+        
         try:
-            # Simple request with timeout
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
+            # Stream the response and read only the start of it - <title> and <meta> live in <head>
+            with self.session.get(url, timeout=10, stream=True, allow_redirects=True) as response:
+                response.raise_for_status()
+                head = response.raw.read(_HEAD_READ_BYTES, decode_content=True)
+                if not _HEAD_END_RE.search(head):
+                    # Unusually large <head> (inlined scripts/styles) - read a bit further
+                    head += response.raw.read(_HEAD_READ_MORE_BYTES, decode_content=True)
             
-            response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
-            response.raise_for_status()
+            page_title, description = self._scan_head(head)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title
-            title = soup.find('title')
-            page_title = title.get_text(strip=True) if title else None
-            
-            # Clean up title (remove common job site suffixes)
-            if page_title:
-                page_title = re.sub(r'\s*[-|]\s*(Indeed\.com|LinkedIn|Glassdoor|Jobs).*$', '', page_title, flags=re.IGNORECASE)
-                page_title = page_title.strip()
-            
-            # Extract meta description
-            description_meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
-            description = description_meta.get('content', '').strip() if description_meta else None
-            
-            # Try to extract company from title patterns
+            # Clean up title (remove common job site suffixes) and pull the company out of
+            # "Job Title at Company Name" / "Job Title - Company Name"
             company_name = None
             if page_title:
-                # Common patterns: "Job Title at Company Name" or "Job Title - Company Name"
-                company_match = re.search(r'\s(?:at|@|-)\s([^-|]+)$', page_title)
-                if company_match:
-                    company_name = company_match.group(1).strip()
-                    page_title = re.sub(r'\s(?:at|@|-)\s[^-|]+$', '', page_title).strip()
+                page_title, company_name = _clean_page_title(page_title)
             
             return {
                 'job_title': page_title,
@@ -232,30 +459,43 @@ class SmartJobURLParser:
             
         except Exception as e:
             logger.warning(f"Could not fetch metadata for {url}: {str(e)}")
+            with self._failed_fetches_lock:
+                self._failed_fetches[url] = time.monotonic()
+                if len(self._failed_fetches) > _FAILED_FETCH_MAX:
+                    # Dicts keep insertion order - drop the oldest failure
+                    self._failed_fetches.pop(next(iter(self._failed_fetches)))
             return {}
     
-    def get_company_suggestions(self, query: str) -> List[str]:
-        """Get company name suggestions based on query"""
-        # This could be enhanced with a company database
-        common_companies = [
-            'Google', 'Microsoft', 'Apple', 'Amazon', 'Meta', 'Netflix',
-            'Tesla', 'Uber', 'Airbnb', 'Spotify', 'Adobe', 'Salesforce',
-            'IBM', 'Oracle', 'Intel', 'NVIDIA', 'Twitter', 'LinkedIn'
-        ]
+    def _scan_head(self, head: bytes):
+        """Title and meta description from raw <head> bytes - regexes first, soup only if they miss"""
+        title_match = _TITLE_TAG_RE.search(head)
+        if title_match:
+            page_title = _decode_field(title_match.group(1))
+            description = None
+            for meta_re in _META_DESCRIPTION_RES:
+                meta_match = meta_re.search(head)
+                if meta_match:
+                    raw = next(group for group in meta_match.groups() if group is not None)
+                    description = _decode_field(raw)
+                    break
+            return page_title, description
         
-        if not query:
-            return common_companies[:10]
+        # Unusual markup (e.g. <title> never closed) - let the parser sort it out
+        soup = BeautifulSoup(head, 'lxml', parse_only=_HEAD_STRAINER)
         
-        # Simple fuzzy matching
-        query_lower = query.lower()
-        matches = [comp for comp in common_companies if query_lower in comp.lower()]
-        return matches[:10]
+        # Extract title
+        title = soup.find('title')
+        page_title = title.get_text(strip=True) if title else None
+        
+        # Extract meta description
+        description_meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+        description = description_meta.get('content', '').strip() if description_meta else None
+        return page_title, description
+    
+    def get_company_suggestions(self, query: str) -> List[str]:
+        """Get company name suggestions based on query"""
+        return self._company_trie.search(query, 10)
     
     def get_title_suggestions(self, query: str) -> List[str]:
         """Get job title suggestions based on query"""
-        if not query:
-            return self.common_job_titles[:10]
-        
-        query_lower = query.lower()
-        matches = [title for title in self.common_job_titles if query_lower in title.lower()]
-        return matches[:10]
\ No newline at end of file
+        return self._title_trie.search(query, 10)
\ No newline at end of file
@@ -32,7 +32,7 @@ export const HtmlViewer: React.FC<HtmlViewerProps> = ({ application, isOpen, onC
     
     try {
       const response = await axios.get(`http://localhost:8000/applications/${application.id}/html`);
-      setHtmlContent(response.data.html_content);
+      setHtmlContent(response.data);
     } catch (err) {
       setError('Failed to load HTML content');
       console.error('Error fetching HTML:', err);
@@ -20,6 +20,15 @@ export const JobViewer: React.FC<JobViewerProps> = ({ application, isOpen, onClo
   const [error, setError] = useState<string>('');
   const [isFullscreen, setIsFullscreen] = useState(false);
   const [viewMode, setViewMode] = useState<ViewMode>('formatted');
+  const [details, setDetails] = useState<JobApplication | null>(null);
+
+  useEffect(() => {
+    // The list endpoint only returns summaries, so load the description and snapshot info on open
+    if (application && isOpen) {
+      setDetails(null);
+      fetchDetails();
+    }
+  }, [application, isOpen]);
 
   useEffect(() => {
     if (application && isOpen && viewMode === 'html') {
@@ -27,6 +36,17 @@ export const JobViewer: React.FC<JobViewerProps> = ({ application, isOpen, onClo
     }
   }, [application, isOpen, viewMode]);
 
+  const fetchDetails = async () => {
+    if (!application) return;
+    
+    try {
+      const response = await axios.get(`http://localhost:8000/applications/${application.id}`);
+      setDetails(response.data);
+    } catch (err) {
+      console.error('Error fetching application details:', err);
+    }
+  };
+
   const fetchHtmlContent = async () => {
     if (!application) return;
     
@@ -35,7 +55,7 @@ export const JobViewer: React.FC<JobViewerProps> = ({ application, isOpen, onClo
     
     try {
       const response = await axios.get(`http://localhost:8000/applications/${application.id}/html`);
-      setHtmlContent(response.data.html_content);
+      setHtmlContent(response.data);
     } catch (err: any) {
       setError(err.response?.data?.detail || 'Failed to load HTML content');
       console.error('Error fetching HTML:', err);
@@ -58,6 +78,8 @@ export const JobViewer: React.FC<JobViewerProps> = ({ application, isOpen, onClo
 
   if (!application) return null;
 
+  const fullApplication = details ?? application;
+
   const renderFormattedView = () => (
     <div className="p-6 space-y-6 overflow-y-auto h-full">
       {/* Header Section */}
@@ -115,9 +137,9 @@ export const JobViewer: React.FC<JobViewerProps> = ({ application, isOpen, onClo
         </h2>
         <div className="bg-muted/50 rounded-lg p-4">
           <div className="prose prose-sm max-w-none">
-            {application.job_description ? (
+            {fullApplication.job_description ? (
               <div className="whitespace-pre-wrap text-foreground leading-relaxed">
-                {application.job_description}
+                {fullApplication.job_description}
               </div>
             ) : (
               <p className="text-muted-foreground italic">No description available</p>
@@ -150,8 +172,8 @@ export const JobViewer: React.FC<JobViewerProps> = ({ application, isOpen, onClo
             <div className="flex items-center gap-3 text-sm">
               <Code className="h-4 w-4 text-muted-foreground" />
               <span className="text-muted-foreground">HTML Snapshot:</span>
-              <span className={application.html_snapshot_path ? 'text-green-600' : 'text-red-600'}>
-                {application.html_snapshot_path ? 'Available' : 'Not available'}
+              <span className={fullApplication.html_snapshot_path ? 'text-green-600' : 'text-red-600'}>
+                {fullApplication.html_snapshot_path ? 'Available' : 'Not available'}
               </span>
             </div>
           </div>
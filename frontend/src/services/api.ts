@@ -2,11 +2,21 @@ import axios from 'axios';
 import { JobApplication } from '../types';
 
 const API_BASE_URL = 'http://localhost:8000';
+const APPLICATIONS_PAGE_SIZE = 200;
 
 export const api = {
   async getApplications(): Promise<JobApplication[]> {
-    const response = await axios.get(`${API_BASE_URL}/applications`);
-    return response.data;
+    // The list endpoint is paginated - keep requesting pages until a short one comes back
+    const applications: JobApplication[] = [];
+    for (let offset = 0; ; offset += APPLICATIONS_PAGE_SIZE) {
+      const response = await axios.get(`${API_BASE_URL}/applications`, {
+        params: { limit: APPLICATIONS_PAGE_SIZE, offset }
+      });
+      applications.push(...response.data);
+      if (response.data.length < APPLICATIONS_PAGE_SIZE) {
+        return applications;
+      }
+    }
   },
 
   async addApplication(url: string): Promise<JobApplication> {
@@ -31,7 +41,7 @@ export const api = {
 
   async getApplicationHtml(id: string): Promise<string> {
     const response = await axios.get(`${API_BASE_URL}/applications/${id}/html`);
-    return response.data.html_content;
+    return response.data;
   },
 
   async deleteApplication(id: string): Promise<void> {
@@ -4,7 +4,7 @@ echo.
 
 echo Starting backend server...
 cd backend
-start "Backend Server" cmd /k python main.py
+start "Backend Server" cmd /k python serve.py
 
 echo Starting frontend server...
 cd ../frontend